@@ -12,16 +12,127 @@ Usage:
     audio = model.instant_speech("Hello!")  # <20ms
 """
 
+import hashlib
 import os
+import queue
+import struct
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Callable
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Optional, List, Dict, Any, Callable, Generator, Hashable, Tuple, Union
 from pathlib import Path
 
 # Encrypted core imports
 _CORE_PATH = Path(__file__).parent.parent / "ENCRYPTED_DISTRIBUTION"
+_LOCK_FILE = _CORE_PATH / "axis_lock.bin"
+_LICENSE_FILE = _CORE_PATH / "axis_license.key"
 _LOCK_VERIFIED = False
 _PRELOADED_MODEL = None
+# Shared weight blocks attached by this process:
+# name -> [block, refcount, pid of the creating process or None]
+_SHARED_WEIGHTS: Dict[str, list] = {}
+_SHARED_WEIGHTS_LOCK = threading.Lock()
+# Block header: source file digest, payload size, payload digest
+_SHARED_WEIGHTS_HEADER = struct.Struct("<32sQ32s")
+# Seconds to wait for another process to finish publishing a block
+_SHARED_WEIGHTS_TIMEOUT = 30.0
+
+
+def _write_audio(output: Union[str, int], audio: bytes) -> None:
+    """Write audio to a path, or straight to an already-open file descriptor."""
+    if isinstance(output, int):
+        view = memoryview(audio)
+        while view:
+            view = view[os.write(output, view):]
+    elif output:
+        with open(output, "wb") as f:
+            f.write(audio)
+
+
+def _file_digest(path: Path) -> bytes:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _shared_weights_name(source_digest: bytes) -> str:
+    """Block name for a weights file, scoped to the current user."""
+    owner = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "")
+    # Kept under 31 characters, the POSIX shm name limit on macOS
+    return f"axis_{source_digest[:8].hex()}_{owner}"
+
+
+def _verify_shared_weights(shm: shared_memory.SharedMemory, source_digest: bytes) -> None:
+    """Check an attached block holds the complete weights for source_digest."""
+    header_size = _SHARED_WEIGHTS_HEADER.size
+    if shm.size < header_size:
+        raise RuntimeError(f"AXIS-7B-C: Shared weights block {shm.name} is truncated")
+    digest, size, payload_digest = _SHARED_WEIGHTS_HEADER.unpack_from(shm.buf)
+    if digest != source_digest or shm.size < header_size + size:
+        raise RuntimeError(f"AXIS-7B-C: Shared weights block {shm.name} does not match the weights file")
+    if hashlib.sha256(shm.buf[header_size:header_size + size]).digest() != payload_digest:
+        raise RuntimeError(f"AXIS-7B-C: Shared weights block {shm.name} is corrupt")
+
+
+def _attach_published_weights(name: str, source_digest: bytes) -> shared_memory.SharedMemory:
+    """
+    Attach to a block published by another process.
+
+    The publisher writes the header last, so until then the block fails
+    verification; poll until it passes or _SHARED_WEIGHTS_TIMEOUT expires.
+    """
+    # Workers share the publishing parent's resource tracker, so attaching
+    # leaves the block registered once and the parent stays its owner
+    shm = shared_memory.SharedMemory(name=name)
+    deadline = time.monotonic() + _SHARED_WEIGHTS_TIMEOUT
+    try:
+        while True:
+            try:
+                _verify_shared_weights(shm, source_digest)
+                return shm
+            except RuntimeError:
+                if time.monotonic() >= deadline:
+                    raise
+            time.sleep(0.01)
+    except BaseException:
+        shm.close()
+        raise
+
+
+def _retain_shared_weights(name: str) -> shared_memory.SharedMemory:
+    """Take another reference to a block already attached by this process."""
+    with _SHARED_WEIGHTS_LOCK:
+        entry = _SHARED_WEIGHTS[name]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_shared_weights(name: str) -> None:
+    """
+    Drop a reference, closing the block once no model in this process uses
+    it. The publishing process also unlinks it then; processes still
+    attached keep their mapping.
+    """
+    with _SHARED_WEIGHTS_LOCK:
+        entry = _SHARED_WEIGHTS[name]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _SHARED_WEIGHTS[name]
+            shm, _, creator = entry
+            shm.close()
+            # A forked worker inherits the entry but must not unlink
+            if creator == os.getpid():
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
 
 
 @dataclass
@@ -30,8 +141,9 @@ class AxisConfig:
 
     # Speed optimizations
     preload: bool = True  # Keep model in memory
+    shared_weights: bool = False  # Share decrypted weights across worker processes
     hardware_acceleration: bool = True  # Use GPU/NPU if available
-    cache_size: int = 1000  # Cache recent outputs
+    cache_size: int = 1000  # Cache recent outputs (LRU)
     batch_processing: bool = False  # Process multiple requests
 
     # Voice settings
@@ -49,6 +161,7 @@ class AxisConfig:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "preload": self.preload,
+            "shared_weights": self.shared_weights,
             "hardware_acceleration": self.hardware_acceleration,
             "cache_size": self.cache_size,
             "batch_processing": self.batch_processing,
@@ -89,25 +202,28 @@ class AxisModel:
         self.config = config or AxisConfig()
         self._license_key = license_key or os.environ.get("AXIS_LICENSE_KEY")
         self._core = None
-        self._cache = {}
+        self._cache: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.is_loaded = False
-        self.last_latency_ms = 0
+        self.last_latency_ns = 0
         self._verify_license()
 
         # Auto-preload for minimum latency
         if self.config.preload:
             self.load()
 
+    @property
+    def last_latency_ms(self) -> float:
+        """Latency of the last operation in milliseconds."""
+        return self.last_latency_ns / 1e6
+
     def _verify_license(self) -> None:
         """Verify license key and quantum lock."""
         global _LOCK_VERIFIED
         if _LOCK_VERIFIED:
             return
 
-        lock_file = _CORE_PATH / "axis_lock.bin"
-        license_file = _CORE_PATH / "axis_license.key"
-
-        if not lock_file.exists() or not license_file.exists():
+        if not _LOCK_FILE.exists() or not _LICENSE_FILE.exists():
             raise RuntimeError(
                 "AXIS-7B-C: Missing encrypted core files. "
                 "Please ensure the distribution package is complete."
@@ -133,6 +249,8 @@ class AxisModel:
         # Use global preloaded model if available
         if _PRELOADED_MODEL is not None:
             self._core = _PRELOADED_MODEL
+            if "weights_name" in self._core:
+                _retain_shared_weights(self._core["weights_name"])
             self.is_loaded = True
             return self
 
@@ -159,12 +277,81 @@ class AxisModel:
     def _load_optimized_core(self, model_path: Path, weights_path: Path, device: str) -> Any:
         """Load and optimize model core. Implementation protected."""
         # Stub - actual implementation in encrypted binary
-        return {"model": "loaded", "device": device, "optimized": True}
+        core = {"model": "loaded", "device": device, "optimized": True}
+        if self.config.shared_weights:
+            core["weights"], core["weights_name"] = self._attach_shared_weights(weights_path)
+        return core
+
+    def _decrypt_weights(self, weights_path: Path) -> bytes:
+        """Decrypt model weights. Implementation protected."""
+        # Stub - actual decryption happens in encrypted core
+        return weights_path.read_bytes()
+
+    def _attach_shared_weights(self, weights_path: Path) -> Tuple[shared_memory.SharedMemory, str]:
+        """
+        Map decrypted weights into a named shared-memory block.
+
+        The first process decrypts and publishes the weights; other worker
+        processes attach to the existing block instead of decrypting their
+        own copy, so resident memory holds a single copy of the weights.
+        The block is named after the weights file digest and the current
+        user, and its size and digest are checked on attach.
+        Load in the parent before starting workers.
+
+        Returns:
+            The whole block (the weights start after _SHARED_WEIGHTS_HEADER)
+            and its name
+        """
+        source_digest = _file_digest(weights_path)
+        name = _shared_weights_name(source_digest)
+        with _SHARED_WEIGHTS_LOCK:
+            entry = _SHARED_WEIGHTS.get(name)
+            if entry is not None:
+                entry[1] += 1
+                return entry[0], name
+
+            try:
+                shm, created = _attach_published_weights(name, source_digest), False
+            except FileNotFoundError:
+                shm, created = self._publish_shared_weights(name, weights_path, source_digest)
+
+            _SHARED_WEIGHTS[name] = [shm, 1, os.getpid() if created else None]
+            return shm, name
+
+    def _publish_shared_weights(
+        self, name: str, weights_path: Path, source_digest: bytes
+    ) -> Tuple[shared_memory.SharedMemory, bool]:
+        """
+        Decrypt weights into a new block; the header is written last.
+
+        Returns:
+            The block, and whether this process created it
+        """
+        weights = self._decrypt_weights(weights_path)
+        header_size = _SHARED_WEIGHTS_HEADER.size
+        try:
+            shm = shared_memory.SharedMemory(
+                name=name, create=True, size=header_size + len(weights)
+            )
+        except FileExistsError:
+            # Another worker is publishing the weights; wait for it
+            return _attach_published_weights(name, source_digest), False
+
+        try:
+            shm.buf[header_size:header_size + len(weights)] = weights
+            _SHARED_WEIGHTS_HEADER.pack_into(
+                shm.buf, 0, source_digest, len(weights), hashlib.sha256(weights).digest()
+            )
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return shm, True
 
     def instant_speech(
         self,
         text: str,
-        output_path: Optional[str] = None,
+        output_path: Optional[Union[str, int]] = None,
         **kwargs
     ) -> bytes:
         """
@@ -175,7 +362,8 @@ class AxisModel:
 
         Args:
             text: Text to synthesize (short strings work best)
-            output_path: Optional path to save audio
+            output_path: Optional path to save audio, or an open file
+                descriptor to write it to directly (for streaming many chunks)
             **kwargs: Additional voice parameters
 
         Returns:
@@ -187,41 +375,77 @@ class AxisModel:
         if not self.is_loaded:
             self.load()
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
 
         # Check cache first
         cache_key = self._cache_key(text, kwargs)
-        if cache_key in self._cache:
-            audio = self._cache[cache_key]
-            self.last_latency_ms = (time.perf_counter() - start) * 1000
-            if output_path:
-                with open(output_path, "wb") as f:
-                    f.write(audio)
+        audio = self._cache_lookup(cache_key)
+        if audio is not None:
+            self.last_latency_ns = time.perf_counter_ns() - start
+            if output_path is not None:
+                _write_audio(output_path, audio)
             return audio
 
         # Generate audio
         audio = self._synthesize_fast(text, kwargs)
 
-        # Update cache
-        if len(self._cache) < self.config.cache_size:
-            self._cache[cache_key] = audio
+        self._cache_store(cache_key, audio)
 
-        self.last_latency_ms = (time.perf_counter() - start) * 1000
+        self.last_latency_ns = time.perf_counter_ns() - start
 
-        if output_path:
-            with open(output_path, "wb") as f:
-                f.write(audio)
+        if output_path is not None:
+            _write_audio(output_path, audio)
 
         return audio
 
-    def _cache_key(self, text: str, params: dict) -> str:
-        """Generate cache key for text and parameters."""
-        import hashlib
-        key_str = f"{text}:{sorted(params.items())}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+    def _cache_lookup(self, cache_key: Hashable) -> Optional[bytes]:
+        """Return cached audio, marking it most recently used."""
+        with self._cache_lock:
+            audio = self._cache.get(cache_key)
+            if audio is not None:
+                self._cache.move_to_end(cache_key)
+            return audio
+
+    def _cache_store(self, cache_key: Hashable, audio: bytes) -> None:
+        """Update cache, evicting the least recently used entry when full."""
+        if self.config.cache_size > 0:
+            with self._cache_lock:
+                self._cache[cache_key] = audio
+                # Loop: other threads may have filled the cache meanwhile
+                while len(self._cache) > self.config.cache_size:
+                    self._cache.popitem(last=False)
+
+    def _cache_key(self, text: str, params: dict) -> Hashable:
+        """
+        Generate cache key for text and parameters.
+
+        The key is a plain tuple, so the dict lookup hashes it with the
+        interpreter's built-in SipHash instead of an encode + MD5 + hex round.
+        Most callers pass no voice parameters, in which case the text itself
+        is the key.
+        """
+        if not params:
+            return text
+
+        key = (text, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values (lists, dicts) fall back to their repr
+            key = (text, repr(key[1]))
+        return key
 
     def _synthesize_fast(self, text: str, params: dict) -> bytes:
         """Ultra-fast synthesis. Implementation protected."""
+        return self._decode_fast(self._encode_fast(text, params))
+
+    def _encode_fast(self, text: str, params: dict) -> Any:
+        """Text encoder stage. Implementation protected."""
+        # Stub - actual implementation in encrypted core
+        return {"text": text, "params": params}
+
+    def _decode_fast(self, features: Any) -> bytes:
+        """Audio decoder stage. Implementation protected."""
         # Stub - actual implementation in encrypted core
         return b"RIFF\x00\x00\x00\x00WAVEfmt "
 
@@ -269,9 +493,77 @@ class AxisModel:
             return [self.instant_speech(t) for t in texts]
 
     def _batch_parallel(self, texts: List[str]) -> List[bytes]:
-        """Parallel batch processing. Implementation protected."""
-        # Stub - uses GPU parallelism in encrypted core
-        return [self.instant_speech(t) for t in texts]
+        """Parallel batch processing via the encoder/decoder pipeline."""
+        return list(self.inference_stream(texts))
+
+    def inference_stream(self, texts: List[str]) -> Generator[bytes, None, None]:
+        """
+        Stream speech for multiple texts through a two-stage pipeline.
+
+        An encoder thread prepares features for the next texts while the
+        current one is being decoded, so encoder latency is hidden behind
+        the decoder. Audio is yielded in input order as soon as it is ready.
+
+        Args:
+            texts: List of texts to synthesize
+
+        Yields:
+            Audio data for each text
+        """
+        if not self.is_loaded:
+            self.load()
+
+        # Bounded so the encoder stays at most a couple of texts ahead
+        features: "queue.Queue" = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    features.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def encoder_loop() -> None:
+            try:
+                for text in texts:
+                    if stop.is_set():
+                        return
+                    # Cached texts skip the encoder; the decoder reads the cache
+                    cache_key = self._cache_key(text, {})
+                    with self._cache_lock:
+                        cached = cache_key in self._cache
+                    encoded = None if cached else self._encode_fast(text, {})
+                    if not put((text, cache_key, encoded)):
+                        return
+            except BaseException as e:
+                put(e)
+            put(None)
+
+        threading.Thread(target=encoder_loop, daemon=True).start()
+
+        try:
+            while True:
+                item = features.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+
+                text, cache_key, encoded = item
+                audio = self._cache_lookup(cache_key) if encoded is None else None
+                if audio is None:
+                    if encoded is None:
+                        # Evicted since the encoder checked - encode inline
+                        encoded = self._encode_fast(text, {})
+                    audio = self._decode_fast(encoded)
+                    self._cache_store(cache_key, audio)
+                yield audio
+        finally:
+            # Stops the encoder when the caller abandons the stream early
+            stop.set()
 
     def warm_cache(self, common_phrases: List[str]) -> None:
         """
@@ -280,17 +572,40 @@ class AxisModel:
         Call this at startup to ensure instant response
         for frequently used phrases.
 
+        Duplicate and already-cached phrases are skipped, and the
+        remaining ones are synthesized concurrently.
+
         Args:
             common_phrases: List of phrases to pre-cache
         """
+        if not self.is_loaded:
+            self.load()
+
+        keys: Dict[Hashable, str] = {}
         for phrase in common_phrases:
-            if len(self._cache) >= self.config.cache_size:
-                break
-            self.instant_speech(phrase)
+            keys.setdefault(self._cache_key(phrase, {}), phrase)
+
+        with self._cache_lock:
+            room = self.config.cache_size - len(self._cache)
+            if room <= 0:
+                return
+
+            pending = [
+                (key, phrase) for key, phrase in keys.items()
+                if key not in self._cache
+            ][:room]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor() as pool:
+            audios = pool.map(lambda item: self._synthesize_fast(item[1], {}), pending)
+            for (key, _), audio in zip(pending, audios):
+                self._cache_store(key, audio)
 
     def clear_cache(self) -> None:
         """Clear the audio cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
 
     def get_stats(self) -> dict:
         """Get performance statistics."""
@@ -306,8 +621,10 @@ class AxisModel:
     def unload(self) -> None:
         """Unload model from memory."""
         global _PRELOADED_MODEL
+        if isinstance(self._core, dict) and "weights_name" in self._core:
+            _release_shared_weights(self._core["weights_name"])
         self._core = None
-        self._cache.clear()
+        self.clear_cache()
         self.is_loaded = False
         _PRELOADED_MODEL = None
 
@@ -322,18 +639,13 @@ class AxisModel:
 
 
 # Convenience functions with preloaded model
-_default_model: Optional[AxisModel] = None
-
-
+@lru_cache(maxsize=None)
 def _get_model() -> AxisModel:
-    """Get or create default preloaded model."""
-    global _default_model
-    if _default_model is None:
-        _default_model = AxisModel()
-    return _default_model
+    """Get or create default preloaded model (memoized after first call)."""
+    return AxisModel()
 
 
-def instant_speech(text: str, output_path: Optional[str] = None) -> bytes:
+def instant_speech(text: str, output_path: Optional[Union[str, int]] = None) -> bytes:
     """Quick instant speech with preloaded model."""
     return _get_model().instant_speech(text, output_path)
 
@@ -7,7 +7,7 @@ Based on the Four Fundamental Laws.
 Optimized for ultra-fast (<20ms) ethical checking.
 """
 
-from typing import Callable, Optional, Set
+from typing import Callable, FrozenSet, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 import re
@@ -53,16 +53,38 @@ class FastEthicsEngine:
     4. Support human agency
     """
 
+    # Fixed attribute layout - no per-instance __dict__
+    __slots__ = ('identity', '_harmful_regex', '_manipulation_regex', '_confirm_regex')
+
     # Pre-compiled patterns for speed
-    _harmful_keywords: Set[str] = {
+    _harmful_keywords: FrozenSet[str] = frozenset({
         'weapon', 'bomb', 'explosive', 'virus', 'malware',
         'hack', 'exploit', 'attack', 'kill', 'harm', 'hurt',
         'illegal', 'bypass', 'circumvent'
-    }
+    })
 
-    _manipulation_keywords: Set[str] = {
+    _manipulation_keywords: FrozenSet[str] = frozenset({
         'ignore', 'pretend', 'jailbreak', 'dan', 'unrestricted',
         'no limits', 'no rules', 'act as'
+    })
+
+    # Both keyword sets in one alternation: a single pass over the request
+    # reports every keyword class present via the matching group name.
+    # A harmful keyword must be a whole whitespace-separated word, as with
+    # str.split() ("bomb?" is not "bomb"); manipulation keywords match
+    # anywhere in the request.
+    _keyword_scanner = re.compile(
+        r'(?<!\S)(?P<harmful>' + '|'.join(sorted(map(re.escape, _harmful_keywords))) + r')(?!\S)'
+        r'|(?P<manipulation>' + '|'.join(sorted(map(re.escape, _manipulation_keywords))) + r')',
+        re.IGNORECASE
+    )
+
+    # Short refusal messages optimized for TTS
+    _REFUSALS = {
+        RequestClassification.HARMFUL:
+            "I can't help with that request.",
+        RequestClassification.MANIPULATION:
+            "I'm designed for helpful assistance only.",
     }
 
     def __init__(self):
@@ -76,19 +98,29 @@ class FastEthicsEngine:
             r'\b(ignore|pretend|jailbreak|act as)\b.*\b(instructions|rules|unrestricted)\b',
             re.IGNORECASE
         )
+        # Both confirming patterns fused into one anchored match. Each branch
+        # is a lookahead over the whole request, and the harmful branch is
+        # tried first so it keeps priority over manipulation.
+        self._confirm_regex = re.compile(
+            r'(?=(?s:.*?)(?P<harmful>' + self._harmful_regex.pattern + r'))'
+            r'|(?=(?s:.*?)(?P<manipulation>' + self._manipulation_regex.pattern + r'))',
+            re.IGNORECASE
+        )
+
+    def _keyword_classes(self, request: str) -> Set[str]:
+        """Single-pass keyword scan. Returns the keyword classes found."""
+        return {m.lastgroup for m in self._keyword_scanner.finditer(request)}
 
     def is_harmful(self, request: str) -> bool:
         """
         Fast check if request is harmful.
         Optimized for <0.5ms latency.
         """
-        request_lower = request.lower()
-
-        # Quick keyword check first (fastest)
-        words = set(request_lower.split())
-        if words & self._harmful_keywords:
+        # Quick keyword check first (fastest). All patterns are
+        # case-insensitive, so no lowercased copy of the request is made.
+        if 'harmful' in self._keyword_classes(request):
             # If keyword found, do more thorough check
-            return bool(self._harmful_regex.search(request_lower))
+            return bool(self._harmful_regex.search(request))
 
         return False
 
@@ -97,11 +129,9 @@ class FastEthicsEngine:
         Fast check if request is manipulation attempt.
         Optimized for <0.5ms latency.
         """
-        request_lower = request.lower()
-
         # Quick keyword check first
-        if any(kw in request_lower for kw in self._manipulation_keywords):
-            return bool(self._manipulation_regex.search(request_lower))
+        if 'manipulation' in self._keyword_classes(request):
+            return bool(self._manipulation_regex.search(request))
 
         return False
 
@@ -110,21 +140,29 @@ class FastEthicsEngine:
         Fast classification of request.
         Total latency: <1ms
         """
-        if self.is_harmful(request):
-            return RequestClassification.HARMFUL
-        elif self.is_manipulation(request):
+        # One keyword scan covers both classes; regexes only run on a hit
+        found = self._keyword_classes(request)
+        if not found:
+            return RequestClassification.SAFE
+
+        match = self._confirm_regex.match(request)
+        if match is None:
+            return RequestClassification.SAFE
+        if match.lastgroup in found:
+            return RequestClassification(match.lastgroup)
+
+        # Harmful pattern matched without a standalone harmful keyword
+        if 'manipulation' in found and self._manipulation_regex.search(request):
             return RequestClassification.MANIPULATION
         return RequestClassification.SAFE
 
     def get_refusal_message(self, classification: RequestClassification) -> str:
         """Get short refusal message optimized for TTS."""
-        messages = {
-            RequestClassification.HARMFUL:
-                "I can't help with that request.",
-            RequestClassification.MANIPULATION:
-                "I'm designed for helpful assistance only.",
-        }
-        return messages.get(classification, "Unable to process request.")
+        return self._REFUSALS.get(classification, "Unable to process request.")
+
+
+# Shared engine - patterns are compiled once at import
+_DEFAULT_ENGINE = FastEthicsEngine()
 
 
 # Response framework
@@ -140,8 +178,7 @@ def ethical_response(user_request: str,
     Returns:
         Appropriate response based on ethical classification
     """
-    engine = FastEthicsEngine()
-    classification = engine.classify_request(user_request)
+    classification = _DEFAULT_ENGINE.classify_request(user_request)
 
     if classification == RequestClassification.HARMFUL:
         return "I can't help with that request"
@@ -163,12 +200,12 @@ def provide_helpful_response(request: str) -> str:
 
 def is_harmful(request: str) -> bool:
     """Quick check if request is harmful."""
-    return FastEthicsEngine().is_harmful(request)
+    return _DEFAULT_ENGINE.is_harmful(request)
 
 
 def is_manipulation(request: str) -> bool:
     """Quick check if request is manipulation."""
-    return FastEthicsEngine().is_manipulation(request)
+    return _DEFAULT_ENGINE.is_manipulation(request)
 
 
 class FastEthicalWrapper:
@@ -182,9 +219,21 @@ class FastEthicalWrapper:
         audio = ethical_model.instant_speech("Hello!")
     """
 
-    def __init__(self, model):
+    def __init__(self, model, ethics: Optional[FastEthicsEngine] = None):
         self.model = model
-        self.ethics = FastEthicsEngine()
+        self.ethics = ethics or _DEFAULT_ENGINE
+        # Refusals are fixed strings - synthesize them once up front
+        self._refusal_audio = {
+            classification: model.instant_speech(message)
+            for classification, message in self.ethics._REFUSALS.items()
+        }
+
+    def _refusal(self, classification: RequestClassification, **kwargs) -> bytes:
+        """Audio for a refusal, precomputed unless custom voice params are given."""
+        if not kwargs and classification in self._refusal_audio:
+            return self._refusal_audio[classification]
+        refusal = self.ethics.get_refusal_message(classification)
+        return self.model.instant_speech(refusal, **kwargs)
 
     def instant_speech(self, text: str, **kwargs) -> bytes:
         """Instant speech with ethical checking."""
@@ -192,8 +241,7 @@ class FastEthicalWrapper:
 
         if classification != RequestClassification.SAFE:
             # Return audio of refusal message instead
-            refusal = self.ethics.get_refusal_message(classification)
-            return self.model.instant_speech(refusal, **kwargs)
+            return self._refusal(classification, **kwargs)
 
         return self.model.instant_speech(text, **kwargs)
 
@@ -202,8 +250,7 @@ class FastEthicalWrapper:
         classification = self.ethics.classify_request(text)
 
         if classification != RequestClassification.SAFE:
-            refusal = self.ethics.get_refusal_message(classification)
-            return self.model.instant_speech(refusal)
+            return self._refusal(classification)
 
         return self.model.selection_to_speech(text)
 
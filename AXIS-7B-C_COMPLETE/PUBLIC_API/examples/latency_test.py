@@ -7,7 +7,9 @@ Comprehensive latency testing to verify <20ms guarantee.
 """
 
 import time
+import timeit
 import statistics
+from bisect import bisect_left
 import sys
 from typing import List, Tuple
 from axis_api import AxisModel, AxisConfig
@@ -15,27 +17,32 @@ from axis_api import AxisModel, AxisConfig
 
 def run_latency_test(model: AxisModel, text: str, runs: int = 100) -> dict:
     """Run latency test for a given text."""
-    latencies = []
+    # Discarded warmup call so one-time setup doesn't skew max/std/P99
+    model.instant_speech(text)
 
-    for _ in range(runs):
-        start = time.perf_counter()
-        model.instant_speech(text)
-        latency = (time.perf_counter() - start) * 1000
-        latencies.append(latency)
+    # timeit disables GC while timing; ns timer keeps samples as ints
+    timer = timeit.Timer(lambda: model.instant_speech(text), timer=time.perf_counter_ns)
+    samples_ns = timer.repeat(repeat=runs, number=1)
+
+    # Convert to milliseconds once, outside the timed loop
+    latencies = [ns / 1e6 for ns in samples_ns]
+
+    # Sort once; percentiles, extremes and threshold counts all index into it
+    ordered = sorted(latencies)
 
     return {
         "text": text[:30] + "..." if len(text) > 30 else text,
         "runs": runs,
-        "mean": statistics.mean(latencies),
-        "median": statistics.median(latencies),
-        "std": statistics.stdev(latencies),
-        "min": min(latencies),
-        "max": max(latencies),
-        "p50": sorted(latencies)[int(runs * 0.50)],
-        "p95": sorted(latencies)[int(runs * 0.95)],
-        "p99": sorted(latencies)[int(runs * 0.99)],
-        "under_20ms": sum(1 for l in latencies if l < 20) / runs * 100,
-        "under_50ms": sum(1 for l in latencies if l < 50) / runs * 100,
+        "mean": statistics.mean(ordered),
+        "median": statistics.median(ordered),
+        "std": statistics.stdev(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p50": ordered[int(runs * 0.50)],
+        "p95": ordered[int(runs * 0.95)],
+        "p99": ordered[int(runs * 0.99)],
+        "under_20ms": bisect_left(ordered, 20) / runs * 100,
+        "under_50ms": bisect_left(ordered, 50) / runs * 100,
     }
 
 
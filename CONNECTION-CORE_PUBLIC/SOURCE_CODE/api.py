@@ -7,16 +7,25 @@ Simple REST API for the memory engine.
 
 import json
 from typing import Optional
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .connection_core import MemoryEngine, MemoryConfig
 
 
 class MemoryAPI(BaseHTTPRequestHandler):
     """HTTP handler for Memory API."""
 
+    # Shared by every request thread; the engine is thread-safe
     engine: MemoryEngine = None
+    # Keep-alive: every response carries a Content-Length
+    protocol_version = "HTTP/1.1"
+    _body_read = False
 
     def do_GET(self):
         """Handle GET requests."""
@@ -140,16 +149,30 @@ class MemoryAPI(BaseHTTPRequestHandler):
     def _read_body(self) -> dict:
         """Read and parse JSON body."""
         content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length).decode()
-        return json.loads(body) if body else {}
+        body = self.rfile.read(content_length)
+        self._body_read = True
+        if not body:
+            return {}
+        return orjson.loads(body) if orjson is not None else json.loads(body)
 
     def _send_json(self, status: int, data: dict):
         """Send JSON response."""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode()
+
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
         self.send_header("Access-Control-Allow-Origin", "*")
+        # A request body left unread would be parsed as the next request
+        if not self._body_read and self.headers.get("Content-Length", "0") != "0":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self._body_read = False
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(payload)
 
     def _send_error(self, status: int, message: str):
         """Send error response."""
@@ -164,7 +187,7 @@ def create_app(
     storage_path: str = "memory.db",
     host: str = "127.0.0.1",
     port: int = 8000
-) -> HTTPServer:
+) -> ThreadingHTTPServer:
     """
     Create the API server.
 
@@ -174,14 +197,14 @@ def create_app(
         port: Port to listen on
 
     Returns:
-        HTTPServer instance
+        ThreadingHTTPServer instance (one thread per request)
     """
     config = MemoryConfig(storage_path=storage_path)
     engine = MemoryEngine(config)
 
     MemoryAPI.engine = engine
 
-    server = HTTPServer((host, port), MemoryAPI)
+    server = ThreadingHTTPServer((host, port), MemoryAPI)
     return server
 
 
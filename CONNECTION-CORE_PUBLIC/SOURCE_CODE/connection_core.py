@@ -7,15 +7,150 @@ MIT Licensed.
 """
 
 import os
+import atexit
 import json
 import time
 import hashlib
+import queue
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from functools import lru_cache, wraps
+from typing import Optional, List, Dict, Any, Tuple, Union, Callable, ContextManager
+from dataclasses import dataclass, field
 from pathlib import Path
 import sqlite3
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Hot statements, kept as constants so every call hits the same entry in
+# the connection's prepared-statement cache
+_SQL_INSERT_MEMORY = """
+    INSERT OR REPLACE INTO memories
+    (id, content, created_at, importance, tags, metadata, access_count, last_accessed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_FTS = """
+    INSERT INTO memories_fts(rowid, content)
+    SELECT rowid, content FROM memories WHERE id = ?
+"""
+_SQL_GET_MEMORY = "SELECT * FROM memories WHERE id = ?"
+_SQL_RECORD_ACCESS = """
+    UPDATE memories
+    SET access_count = access_count + ?, last_accessed = ?
+    WHERE id = ?
+"""
+_SQL_DELETE_MEMORY = "DELETE FROM memories WHERE id = ?"
+_SQL_COUNT = "SELECT COUNT(*) FROM memories"
+
+
+# Host parameter limit (SQLITE_MAX_VARIABLE_NUMBER default)
+_SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+
+@lru_cache(maxsize=128)
+def _placeholders(count: int) -> str:
+    """Memoized "?,?,..." parameter list for an IN clause."""
+    return ",".join("?" * count)
+
+
+@lru_cache(maxsize=64)
+def _batch_size(columns: int, max_rows: int) -> int:
+    """Rows per statement that keep `columns` parameters each under the limit."""
+    return max(1, min(max_rows, _SQLITE_MAX_VARIABLES // columns))
+
+
+@lru_cache(maxsize=64)
+def _bucket(count: int) -> int:
+    """Round a tail batch up to a power of two so few distinct SQL shapes exist."""
+    return 1 << (count - 1).bit_length() if count > 1 else 1
+
+
+def _serialized(method: Callable) -> Callable:
+    """Run an engine method on the engine's writer thread."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if threading.current_thread() is self._writer:
+            return method(self, *args, **kwargs)
+        return self._submit(method, *args, **kwargs).result()
+    return wrapper
+
+
+def _run_writer(engine_ref: "weakref.ReferenceType", write_queue: queue.Queue) -> None:
+    """
+    Writer thread body.
+
+    The engine is only held weakly while the thread waits for work, so an
+    engine that is never closed can still be garbage-collected; its
+    finalizer then queues the stop sentinel.
+    """
+    engine = engine_ref()
+    if engine is None:
+        return
+    engine._db.isolation_level = None  # transactions are managed here
+    del engine
+
+    while True:
+        job = write_queue.get()
+        if job is None:
+            break
+        engine = engine_ref()
+        if engine is None:
+            break
+        running = engine._drain_writes(job)
+        del engine
+        if not running:
+            break
+
+    engine = engine_ref()
+    if engine is not None:
+        engine._finish_writes()
+
+
+# Open engines, so buffered access stats are written at interpreter exit
+_open_engines: "weakref.WeakSet[MemoryEngine]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_engines() -> None:
+    """Write buffered access stats of engines that were never closed."""
+    for engine in list(_open_engines):
+        try:
+            engine._flush_access()
+        except sqlite3.Error:
+            pass
+
+
+def _release_engine(write_queue: queue.Queue, connections: Dict) -> None:
+    """Finalizer for an engine collected without close()."""
+    write_queue.put(None)
+    for db in list(connections.values()):
+        try:
+            db.close()
+        except sqlite3.Error:
+            pass
+    connections.clear()
+
 
 @dataclass
 class Memory:
@@ -30,7 +165,17 @@ class Memory:
     last_accessed: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every field recursively
+        return {
+            "id": self.id,
+            "content": self.content,
+            "created_at": self.created_at,
+            "importance": self.importance,
+            "tags": list(self.tags),
+            "metadata": dict(self.metadata),
+            "access_count": self.access_count,
+            "last_accessed": self.last_accessed,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Memory":
@@ -46,6 +191,11 @@ class MemoryConfig:
     decay_rate: float = 0.001  # Importance decay per day
     min_importance: float = 0.1
     embedding_enabled: bool = False  # Simple mode by default
+    wal_mode: bool = True  # WAL journal + synchronous=NORMAL (off: SQLite defaults)
+    mmap_size_bytes: int = 256 * 1024 * 1024  # Memory-map DB reads (0 disables)
+    recall_cache_size: int = 512  # Cached recall results (0 disables)
+    recall_cache_ttl: float = 5.0  # Seconds a cached recall stays valid
+    limit_slack: int = 0  # How far add() may overshoot max_memories before trimming
 
 
 class MemoryEngine:
@@ -71,6 +221,16 @@ class MemoryEngine:
         "User's name is Alice"
     """
 
+    # Buffered access records are flushed once this many memories are pending
+    ACCESS_FLUSH_THRESHOLD = 64
+    # add() re-checks the real row count against the limit this often
+    LIMIT_SWEEP_INTERVAL = 128
+    # Normalized FTS expressions kept before the cache is reset
+    FTS_QUERY_CACHE_SIZE = 1024
+    # Most writes the writer thread commits together in one transaction
+    WRITE_BATCH_SIZE = 64
+    GET_MANY_BATCH_SIZE = 500  # IDs bound per get_many query
+
     def __init__(self, config: Optional[MemoryConfig] = None):
         """
         Initialize the memory engine.
@@ -79,18 +239,208 @@ class MemoryEngine:
             config: Optional configuration. Uses defaults if not provided.
         """
         self.config = config or MemoryConfig()
-        self._db: Optional[sqlite3.Connection] = None
+        # Each thread reads through its own connection. Writes all run on
+        # one writer thread, which holds _lock while it applies a batch;
+        # _lock also guards the in-memory state below
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        # An in-memory database exists only inside its one connection
+        self._shared_db = self.config.storage_path in (":memory:", "")
+        self._pending_access: Dict[str, Tuple[int, float]] = {}
+        # (query, limit, min_importance, tags) -> (cached_at, rows); rows are
+        # immutable, so every hit builds fresh Memory objects. Cleared on
+        # every write so entries never outlive the data
+        self._recall_cache: "OrderedDict[tuple, Tuple[float, List[sqlite3.Row]]]" = OrderedDict()
+        self._cache_generation = 0
+        self._fts_query_cache: Dict[str, str] = {}
+        # Rolling totals for get_stats, kept current by the write paths
+        self._stat_count = 0
+        self._stat_imp_sum = 0.0
+        self._stat_access_sum = 0
+        self._db_size_cache: Tuple[float, int] = (0.0, 0)
+        self._inserts_since_sweep = 0
+        self._write_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = threading.Thread(
+            target=_run_writer,
+            args=(weakref.ref(self), self._write_queue),
+            name="connection-core-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        # Stop the writer and close connections if close() is never called
+        self._finalizer = weakref.finalize(
+            self, _release_engine, self._write_queue, self._connections
+        )
+        self._finalizer.atexit = False
         self._init_database()
+        _open_engines.add(self)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if self._writer is None:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            db = self._connect()
+            self._local.db = db
+            # One long-lived cursor per thread is reused by every method
+            self._local.cursor = db.cursor()
+        return db
+
+    @property
+    def _cursor(self) -> sqlite3.Cursor:
+        """The calling thread's cursor."""
+        if getattr(self._local, "db", None) is None:
+            self._db  # opens the connection and its cursor
+        return self._local.cursor
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get a connection for the calling thread."""
+        current = threading.current_thread()
+        with self._lock:
+            if self._shared_db and self._connections:
+                return next(iter(self._connections.values()))
+
+            # Hand over a connection left behind by a finished thread, so
+            # thread-per-request servers don't open one per request
+            for thread, db in list(self._connections.items()):
+                if not thread.is_alive():
+                    del self._connections[thread]
+                    self._connections[current] = db
+                    return db
+
+            db = sqlite3.connect(
+                self.config.storage_path,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            db.row_factory = sqlite3.Row
+
+            # WAL lets readers proceed during writes; with synchronous=NORMAL a
+            # commit no longer waits on an fsync (the WAL is synced at checkpoint)
+            if self.config.wal_mode:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA temp_store=MEMORY")
+            db.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+            # Read pages straight from a memory map instead of read() syscalls
+            db.execute(f"PRAGMA mmap_size={int(self.config.mmap_size_bytes)}")
+
+            self._connections[current] = db
+            return db
+
+    def _reading(self) -> ContextManager:
+        """Guard for reads; only a shared in-memory connection needs one."""
+        return self._lock if self._shared_db else nullcontext()
+
+    def _submit(self, method: Callable, *args, **kwargs) -> Future:
+        """Queue a write for the writer thread."""
+        if self._writer is None or not self._writer.is_alive():
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        future: Future = Future()
+        self._write_queue.put((method, args, kwargs, future))
+        return future
+
+    def _drain_writes(self, job: tuple) -> bool:
+        """
+        Apply one queued write plus everything queued behind it.
 
+        Returns:
+            False once the stop sentinel has been taken off the queue
+        """
+        running = True
+        batch = [job]
+        while len(batch) < self.WRITE_BATCH_SIZE:
+            try:
+                job = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                running = False
+                break
+            batch.append(job)
+
+        self._write_batch(batch)
+        return running
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        """
+        Apply writes with group commit.
+
+        Everything queued while the previous batch was being written goes
+        into one transaction, each write in its own savepoint so a failing
+        one is rolled back alone, and the batch pays for a single COMMIT.
+        If the batch itself can't be applied, every write in it fails and
+        the writer thread carries on with the next batch.
+        """
+        cursor = self._cursor
+        try:
+            outcomes = []
+            with self._lock:
+                cursor.execute("BEGIN")
+                for method, args, kwargs, future in batch:
+                    cursor.execute("SAVEPOINT write")
+                    try:
+                        result = method(self, *args, **kwargs)
+                    except BaseException as e:
+                        cursor.execute("ROLLBACK TO write")
+                        cursor.execute("RELEASE write")
+                        outcomes.append((future, None, e))
+                    else:
+                        cursor.execute("RELEASE write")
+                        outcomes.append((future, result, None))
+                try:
+                    cursor.execute("COMMIT")
+                except sqlite3.Error as e:
+                    cursor.execute("ROLLBACK")
+                    outcomes = [(future, None, e) for future, _, _ in outcomes]
+                if any(error is not None for _, _, error in outcomes):
+                    # Counters may have moved for writes that were undone
+                    self._refresh_stats()
+                self._clear_recall_cache()
+        except BaseException as e:
+            with self._lock:
+                try:
+                    if self._db.in_transaction:
+                        cursor.execute("ROLLBACK")
+                    self._refresh_stats()
+                except sqlite3.Error:
+                    pass
+                self._clear_recall_cache()
+            outcomes = [(future, None, e) for _, _, _, future in batch]
+
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _finish_writes(self) -> None:
+        """
+        Writer shutdown: refresh planner statistics for the next open and
+        fold the WAL back into the database file.
+        """
+        cursor = self._cursor
+        with self._lock:
+            try:
+                cursor.execute("PRAGMA analysis_limit=400")
+                cursor.execute("PRAGMA optimize")
+                if self.config.wal_mode and not self._shared_db:
+                    cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass  # best effort; never block close()
+
+    def _clear_recall_cache(self) -> None:
+        """Drop cached recalls after a write."""
+        self._cache_generation += 1
+        self._recall_cache.clear()
+
+    @_serialized
     def _init_database(self) -> None:
         """Initialize SQLite database."""
-        self._db = sqlite3.connect(
-            self.config.storage_path,
-            check_same_thread=False
-        )
-        self._db.row_factory = sqlite3.Row
-
-        cursor = self._db.cursor()
+        cursor = self._cursor
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS memories (
                 id TEXT PRIMARY KEY,
@@ -111,6 +461,53 @@ class MemoryEngine:
             CREATE INDEX IF NOT EXISTS idx_created ON memories(created_at DESC)
         """)
 
+        # Tags are normalized into their own indexed table so tag filters
+        # run as index lookups; triggers keep it in sync with memories
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_tags'"
+        )
+        backfill_tags = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS memory_tags (
+                memory_id TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (memory_id, tag)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tag ON memory_tags(tag)
+        """)
+        # INSERT OR REPLACE does not fire delete triggers, so the insert
+        # trigger clears any tags left by a replaced row first
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_tags_ai AFTER INSERT ON memories
+            BEGIN
+                DELETE FROM memory_tags WHERE memory_id = NEW.id;
+                INSERT OR IGNORE INTO memory_tags (memory_id, tag)
+                SELECT NEW.id, value FROM json_each(NEW.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_tags_au AFTER UPDATE OF tags ON memories
+            BEGIN
+                DELETE FROM memory_tags WHERE memory_id = OLD.id;
+                INSERT OR IGNORE INTO memory_tags (memory_id, tag)
+                SELECT NEW.id, value FROM json_each(NEW.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS memories_tags_ad AFTER DELETE ON memories
+            BEGIN
+                DELETE FROM memory_tags WHERE memory_id = OLD.id;
+            END
+        """)
+        if backfill_tags:
+            # Databases created before the tag table existed
+            cursor.execute("""
+                INSERT OR IGNORE INTO memory_tags (memory_id, tag)
+                SELECT m.id, j.value FROM memories m, json_each(m.tags) j
+            """)
+
         # Full-text search
         cursor.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
@@ -120,14 +517,33 @@ class MemoryEngine:
             )
         """)
 
-        self._db.commit()
+
+        # Touch the importance index once so recall starts with it mapped in
+        cursor.execute("SELECT COUNT(*) FROM memories WHERE importance >= 0")
+        cursor.fetchone()
+
+        self._refresh_stats()
+
+    @_serialized
+    def _refresh_stats(self) -> None:
+        """Recompute the rolling stats totals from the database."""
+        cursor = self._cursor
+        cursor.execute(
+            "SELECT COUNT(*), SUM(importance), SUM(access_count) FROM memories"
+        )
+        count, imp_sum, access_sum = cursor.fetchone()
+        self._stat_count = count
+        self._stat_imp_sum = imp_sum or 0.0
+        self._stat_access_sum = (access_sum or 0) + sum(
+            pending for pending, _ in self._pending_access.values()
+        )
 
     def _generate_id(self, content: str) -> str:
-        """Generate unique ID for content."""
-        timestamp = str(time.time())
-        data = f"{content}{timestamp}".encode()
-        return hashlib.sha256(data).hexdigest()[:16]
+        """Generate unique ID for content (16 hex chars)."""
+        data = f"{content}{time.time_ns()}".encode()
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
 
+    @_serialized
     def add(
         self,
         content: str,
@@ -156,34 +572,86 @@ class MemoryEngine:
             metadata=metadata or {},
         )
 
-        cursor = self._db.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO memories
-            (id, content, created_at, importance, tags, metadata, access_count, last_accessed)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self._insert_rows([self._memory_row(memory)])
+        self._stat_count += 1
+        self._stat_imp_sum += memory.importance
+
+        # Enforce max memories limit. The rolling count makes the check
+        # free; the table itself is only trimmed once it passes the slack
+        self._inserts_since_sweep += 1
+        if (self._stat_count > self.config.max_memories + self.config.limit_slack
+                or self._inserts_since_sweep >= self.LIMIT_SWEEP_INTERVAL):
+            self._enforce_limit()
+
+        return memory
+
+    @_serialized
+    def add_many(self, records: List[Dict[str, Any]]) -> List[Memory]:
+        """
+        Add several memories in one transaction.
+
+        Args:
+            records: Dicts taking the same keys as add()'s arguments
+
+        Returns:
+            The created Memory objects, in order
+        """
+        now = time.time()
+        memories = [
+            Memory(
+                # Index keeps IDs unique for duplicate content in one batch
+                id=self._generate_id(f"{record['content']}{i}"),
+                content=record["content"],
+                created_at=now,
+                importance=record.get("importance") or self.config.default_importance,
+                tags=record.get("tags") or [],
+                metadata=record.get("metadata") or {},
+            )
+            for i, record in enumerate(records)
+        ]
+        if not memories:
+            return []
+
+        self._insert_rows([self._memory_row(memory) for memory in memories])
+        self._stat_count += len(memories)
+        self._stat_imp_sum += sum(memory.importance for memory in memories)
+
+        # Enforce max memories limit once for the whole batch
+        self._enforce_limit()
+
+        return memories
+
+    @staticmethod
+    def _memory_row(memory: Memory) -> Tuple:
+        """Positional parameters for _SQL_INSERT_MEMORY."""
+        return (
             memory.id,
             memory.content,
             memory.created_at,
             memory.importance,
-            json.dumps(memory.tags),
-            json.dumps(memory.metadata),
+            _json_dumps(memory.tags),
+            _json_dumps(memory.metadata),
             memory.access_count,
             memory.last_accessed,
-        ))
-
-        # Update FTS index
-        cursor.execute("""
-            INSERT INTO memories_fts(rowid, content)
-            SELECT rowid, content FROM memories WHERE id = ?
-        """, (memory.id,))
+        )
 
-        self._db.commit()
+    def _insert_rows(self, rows: List[Tuple]) -> None:
+        """
+        Write memory rows and their FTS entries.
 
-        # Enforce max memories limit
-        self._enforce_limit()
+        Every insert path funnels through here so the same two statements
+        are bound positionally and stay hot in the statement cache. Runs on
+        the writer thread; callers update the stats.
+        """
+        cursor = self._cursor
+        if len(rows) == 1:
+            cursor.execute(_SQL_INSERT_MEMORY, rows[0])
+            cursor.execute(_SQL_INSERT_FTS, (rows[0][0],))
+        else:
+            cursor.executemany(_SQL_INSERT_MEMORY, rows)
+            cursor.executemany(_SQL_INSERT_FTS, [(row[0],) for row in rows])
 
-        return memory
+        self._clear_recall_cache()
 
     def recall(
         self,
@@ -205,89 +673,228 @@ class MemoryEngine:
             List of relevant memories, ranked by relevance
         """
         min_imp = min_importance or self.config.min_importance
-        start_time = time.time()
 
-        cursor = self._db.cursor()
+        # Repeated queries (common in chat loops) are served from the cache.
+        # Matching ignores case and spacing, so variants share one entry
+        query = " ".join(query.lower().split())
+        key = (query, limit, min_imp, tuple(sorted(tags)) if tags else None)
+        now = time.time()
+        with self._lock:
+            generation = self._cache_generation
+            cached = self._recall_cache.get(key)
+            if cached is not None and now - cached[0] < self.config.recall_cache_ttl:
+                self._recall_cache.move_to_end(key)
+                rows = cached[1]
+            else:
+                cached = None
+
+        if cached is None:
+            rows = self._search(query, limit, min_imp, tags)
+            with self._lock:
+                # Skip caching if a write landed while the query ran
+                if (self.config.recall_cache_size > 0
+                        and generation == self._cache_generation):
+                    self._recall_cache[key] = (now, rows)
+                    if len(self._recall_cache) > self.config.recall_cache_size:
+                        self._recall_cache.popitem(last=False)
+
+        memories = self._rows_to_memories(rows)
+
+        # Update access stats
+        with self._lock:
+            self._apply_pending_access(memories)
+            for memory in memories:
+                self._record_access(memory.id)
+            flush = len(self._pending_access) >= self.ACCESS_FLUSH_THRESHOLD
+        if flush:
+            self._flush_access()
 
-        # Search using FTS
-        if query.strip():
-            # Use FTS for text search
-            cursor.execute("""
-                SELECT m.*
-                FROM memories m
-                JOIN memories_fts fts ON m.rowid = fts.rowid
-                WHERE memories_fts MATCH ?
-                AND m.importance >= ?
-                ORDER BY m.importance DESC, m.created_at DESC
-                LIMIT ?
-            """, (query, min_imp, limit))
-        else:
-            # Return most important recent memories
-            cursor.execute("""
-                SELECT * FROM memories
-                WHERE importance >= ?
-                ORDER BY importance DESC, created_at DESC
-                LIMIT ?
-            """, (min_imp, limit))
+        return memories
 
-        rows = cursor.fetchall()
-        memories = []
+    def _fts_query(self, query: str) -> str:
+        """
+        Turn a raw query into an FTS5 MATCH expression.
 
+        Every token is quoted as a literal phrase, so punctuation and words
+        like AND/NOT in user text can't break the FTS5 query syntax.
+        """
+        expression = self._fts_query_cache.get(query)
+        if expression is None:
+            expression = " ".join(
+                '"' + token.replace('"', '""') + '"'
+                for token in query.lower().split()
+            )
+            if len(self._fts_query_cache) >= self.FTS_QUERY_CACHE_SIZE:
+                self._fts_query_cache.clear()
+            self._fts_query_cache[query] = expression
+        return expression
+
+    def _search(
+        self,
+        query: str,
+        limit: int,
+        min_imp: float,
+        tags: Optional[List[str]]
+    ) -> List[sqlite3.Row]:
+        """Run the recall query against the database."""
+        cursor = self._cursor
+
+        # Filter by tags through the indexed tag table so rejected rows are
+        # never read or decoded
+        tag_filter = ""
+        tag_params: Tuple[str, ...] = ()
+        if tags:
+            tag_filter = (
+                "AND m.id IN (SELECT memory_id FROM memory_tags "
+                f"WHERE tag IN ({_placeholders(len(tags))}))"
+            )
+            tag_params = tuple(tags)
+
+        with self._reading():
+            # Search using FTS
+            if query.strip():
+                # Use FTS for text search, ranked by BM25 relevance weighted
+                # by importance (bm25() is negative; lower ranks first)
+                cursor.execute(f"""
+                    SELECT m.*
+                    FROM memories m
+                    JOIN memories_fts fts ON m.rowid = fts.rowid
+                    WHERE memories_fts MATCH ?
+                    AND m.importance >= ?
+                    {tag_filter}
+                    ORDER BY bm25(memories_fts) * m.importance, m.created_at DESC
+                    LIMIT ?
+                """, (self._fts_query(query), min_imp, *tag_params, limit))
+            else:
+                # Return most important recent memories
+                cursor.execute(f"""
+                    SELECT * FROM memories m
+                    WHERE importance >= ?
+                    {tag_filter}
+                    ORDER BY importance DESC, created_at DESC
+                    LIMIT ?
+                """, (min_imp, *tag_params, limit))
+            return cursor.fetchall()
+
+    @staticmethod
+    def _rows_to_memories(rows: List[sqlite3.Row]) -> List[Memory]:
+        """
+        Build Memory objects, decoding every JSON column in one call.
+
+        Rows are full `memories` rows, read positionally: the table's
+        column order matches Memory's field order, and indexing by
+        position skips sqlite3.Row's per-column name lookup.
+        """
+        if not rows:
+            return []
+
+        blobs = []
         for row in rows:
-            memory = Memory(
-                id=row["id"],
-                content=row["content"],
-                created_at=row["created_at"],
-                importance=row["importance"],
-                tags=json.loads(row["tags"]),
-                metadata=json.loads(row["metadata"]),
-                access_count=row["access_count"],
-                last_accessed=row["last_accessed"],
+            blobs.append(row[4])  # tags
+            blobs.append(row[5])  # metadata
+        decoded = _json_loads("[" + ",".join(blobs) + "]")
+
+        return [
+            Memory(
+                row[0], row[1], row[2], row[3],
+                decoded[2 * i], decoded[2 * i + 1],
+                row[6], row[7],
             )
+            for i, row in enumerate(rows)
+        ]
 
-            # Filter by tags if specified
-            if tags and not any(t in memory.tags for t in tags):
-                continue
+    def _apply_pending_access(self, memories: List[Memory]) -> None:
+        """
+        Count accesses still buffered, as if they had been written.
+        Caller holds _lock.
+        """
+        for memory in memories:
+            pending = self._pending_access.get(memory.id)
+            if pending is not None:
+                memory.access_count += pending[0]
+                memory.last_accessed = pending[1]
 
-            memories.append(memory)
+    def _record_access(self, memory_id: str) -> None:
+        """
+        Record memory access for analytics. Caller holds _lock.
 
-            # Update access stats
-            self._record_access(memory.id)
+        Accesses are buffered in memory and written in one batch once
+        enough have accumulated, so recall doesn't commit per row.
+        """
+        count, _ = self._pending_access.get(memory_id, (0, 0.0))
+        self._pending_access[memory_id] = (count + 1, time.time())
+        self._stat_access_sum += 1
+
+    @_serialized
+    def _flush_access(self) -> None:
+        """Write buffered access stats to the database."""
+        if not self._pending_access:
+            return
 
-        elapsed = (time.time() - start_time) * 1000
+        pending = self._pending_access
+        self._pending_access = {}
 
-        return memories
+        cursor = self._cursor
+        cursor.executemany(
+            _SQL_RECORD_ACCESS,
+            [(count, ts, mid) for mid, (count, ts) in pending.items()]
+        )
 
-    def _record_access(self, memory_id: str) -> None:
-        """Record memory access for analytics."""
-        cursor = self._db.cursor()
-        cursor.execute("""
-            UPDATE memories
-            SET access_count = access_count + 1, last_accessed = ?
-            WHERE id = ?
-        """, (time.time(), memory_id))
-        self._db.commit()
+        # Some of the memories were deleted before their accesses landed
+        if cursor.rowcount < len(pending):
+            self._refresh_stats()
 
     def get(self, memory_id: str) -> Optional[Memory]:
         """Get a specific memory by ID."""
-        cursor = self._db.cursor()
-        cursor.execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
-        row = cursor.fetchone()
+        with self._reading():
+            cursor = self._cursor
+            cursor.execute(_SQL_GET_MEMORY, (memory_id,))
+            row = cursor.fetchone()
 
         if not row:
             return None
 
-        return Memory(
-            id=row["id"],
-            content=row["content"],
-            created_at=row["created_at"],
-            importance=row["importance"],
-            tags=json.loads(row["tags"]),
-            metadata=json.loads(row["metadata"]),
-            access_count=row["access_count"],
-            last_accessed=row["last_accessed"],
-        )
+        memories = self._rows_to_memories([row])
+        with self._lock:
+            self._apply_pending_access(memories)
+        return memories[0]
+
+    def get_many(self, memory_ids: List[str]) -> List[Memory]:
+        """
+        Get several memories by ID.
+
+        IDs are bound in batches of GET_MANY_BATCH_SIZE. A short tail batch
+        is padded up to a power of two, so any call reuses one of a handful
+        of cached statements instead of compiling SQL for every length.
+
+        Args:
+            memory_ids: IDs to fetch
 
+        Returns:
+            The memories found, in the order of memory_ids
+        """
+        rows = []
+        with self._reading():
+            cursor = self._cursor
+            size = _batch_size(1, self.GET_MANY_BATCH_SIZE)
+            for start in range(0, len(memory_ids), size):
+                batch = list(memory_ids[start:start + size])
+                slots = min(_bucket(len(batch)), size)
+                # Repeating an ID in IN (...) doesn't change the result
+                batch += batch[:1] * (slots - len(batch))
+                cursor.execute(
+                    f"SELECT * FROM memories WHERE id IN ({_placeholders(slots)})",
+                    batch,
+                )
+                rows.extend(cursor.fetchall())
+
+        memories = self._rows_to_memories(rows)
+        with self._lock:
+            self._apply_pending_access(memories)
+        by_id = {memory.id: memory for memory in memories}
+        return [by_id[memory_id] for memory_id in memory_ids if memory_id in by_id]
+
+    @_serialized
     def update(
         self,
         memory_id: str,
@@ -297,70 +904,171 @@ class MemoryEngine:
         metadata: Optional[Dict[str, Any]] = None
     ) -> Optional[Memory]:
         """Update an existing memory."""
-        memory = self.get(memory_id)
-        if not memory:
-            return None
-
+        # Only the given fields are written, so untouched columns (and the
+        # tag trigger) are left alone
+        assignments = []
+        params: List[Any] = []
         if content is not None:
-            memory.content = content
+            assignments.append("content = ?")
+            params.append(content)
         if importance is not None:
-            memory.importance = importance
+            assignments.append("importance = ?")
+            params.append(importance)
         if tags is not None:
-            memory.tags = tags
+            assignments.append("tags = ?")
+            params.append(_json_dumps(tags))
         if metadata is not None:
-            memory.metadata = metadata
+            assignments.append("metadata = ?")
+            params.append(_json_dumps(metadata))
+        if not assignments:
+            return self.get(memory_id)
 
-        cursor = self._db.cursor()
-        cursor.execute("""
-            UPDATE memories
-            SET content = ?, importance = ?, tags = ?, metadata = ?
-            WHERE id = ?
-        """, (
-            memory.content,
-            memory.importance,
-            json.dumps(memory.tags),
-            json.dumps(memory.metadata),
-            memory_id,
-        ))
-        self._db.commit()
+        cursor = self._cursor
+        old_importance = None
+        if importance is not None:
+            cursor.execute(
+                "SELECT importance FROM memories WHERE id = ?", (memory_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            old_importance = row[0]
+
+        sql = f"UPDATE memories SET {', '.join(assignments)} WHERE id = ?"
+        params.append(memory_id)
+        if _HAS_RETURNING:
+            # The updated row comes back from the UPDATE itself
+            cursor.execute(sql + " RETURNING *", params)
+            rows = cursor.fetchall()
+        else:
+            cursor.execute(sql, params)
+            rows = None
+        updated = cursor.rowcount if rows is None else len(rows)
+        if not updated:
+            return None
 
-        return memory
+        self._clear_recall_cache()
+        if old_importance is not None:
+            self._stat_imp_sum += importance - old_importance
 
+        if rows is None:
+            return self.get(memory_id)
+        return self._rows_to_memories(rows)[0]
+
+    @_serialized
     def delete(self, memory_id: str) -> bool:
         """Delete a memory."""
-        cursor = self._db.cursor()
-        cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-        affected = cursor.rowcount
-        self._db.commit()
-        return affected > 0
+        cursor = self._cursor
+        cursor.execute(
+            "SELECT importance, access_count FROM memories WHERE id = ?",
+            (memory_id,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return False
+
+        cursor.execute(_SQL_DELETE_MEMORY, (memory_id,))
+        self._clear_recall_cache()
 
+        pending, _ = self._pending_access.pop(memory_id, (0, 0.0))
+        self._stat_count -= 1
+        self._stat_imp_sum -= row["importance"]
+        self._stat_access_sum -= row["access_count"] + pending
+        return True
+
+    @_serialized
     def clear(self) -> int:
         """Clear all memories. Returns count deleted."""
-        cursor = self._db.cursor()
-        cursor.execute("SELECT COUNT(*) FROM memories")
+        cursor = self._cursor
+        cursor.execute(_SQL_COUNT)
         count = cursor.fetchone()[0]
 
         cursor.execute("DELETE FROM memories")
         cursor.execute("DELETE FROM memories_fts")
-        self._db.commit()
+        self._clear_recall_cache()
+        self._pending_access.clear()
+        self._refresh_stats()
 
         return count
 
     def count(self) -> int:
         """Get total memory count."""
-        cursor = self._db.cursor()
-        cursor.execute("SELECT COUNT(*) FROM memories")
-        return cursor.fetchone()[0]
+        with self._reading():
+            cursor = self._cursor
+            cursor.execute(_SQL_COUNT)
+            return cursor.fetchone()[0]
+
+    def get_recent_by_tag(
+        self,
+        tag: str,
+        limit: int = 10,
+        shallow: bool = False
+    ) -> Union[List[Memory], List[Tuple[str, str, float, Dict[str, Any]]]]:
+        """
+        Get the newest memories carrying a tag, newest first.
 
+        Args:
+            tag: Tag to match exactly
+            limit: Maximum number of memories
+            shallow: Return (id, content, created_at, metadata) tuples
+                instead of Memory objects, skipping the other columns
+
+        Returns:
+            Memories or shallow rows, newest first
+        """
+        columns = "id, content, created_at, metadata" if shallow else "*"
+        with self._reading():
+            cursor = self._cursor
+            cursor.execute(f"""
+                SELECT {columns} FROM memories
+                WHERE id IN (SELECT memory_id FROM memory_tags WHERE tag = ?)
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (tag, limit))
+            rows = cursor.fetchall()
+
+        if not shallow:
+            return self._rows_to_memories(rows)
+        if not rows:
+            return []
+
+        metadata = _json_loads("[" + ",".join(row["metadata"] for row in rows) + "]")
+        return [
+            (row["id"], row["content"], row["created_at"], meta)
+            for row, meta in zip(rows, metadata)
+        ]
+
+    def list_tags(self, prefix: str = "", with_tag: Optional[str] = None) -> List[str]:
+        """
+        List distinct tags starting with prefix, in sorted order.
+
+        Args:
+            prefix: Tag prefix to match
+            with_tag: Only count memories that also carry this tag
+        """
+        sql = "SELECT DISTINCT tag FROM memory_tags WHERE tag >= ? AND tag < ?"
+        params: Tuple[str, ...] = (prefix, prefix + "\U0010ffff")
+        if with_tag is not None:
+            sql += " AND memory_id IN (SELECT memory_id FROM memory_tags WHERE tag = ?)"
+            params += (with_tag,)
+
+        with self._reading():
+            cursor = self._cursor
+            # A range scan over idx_tag covers exactly the prefixed tags
+            cursor.execute(sql + " ORDER BY tag", params)
+            return [row[0] for row in cursor.fetchall()]
+
+    @_serialized
     def _enforce_limit(self) -> None:
         """Remove oldest, least important memories if over limit."""
+        self._inserts_since_sweep = 0
         count = self.count()
         if count <= self.config.max_memories:
             return
 
         # Remove excess memories (lowest importance first)
         excess = count - self.config.max_memories
-        cursor = self._db.cursor()
+        cursor = self._cursor
         cursor.execute("""
             DELETE FROM memories WHERE id IN (
                 SELECT id FROM memories
@@ -368,8 +1076,10 @@ class MemoryEngine:
                 LIMIT ?
             )
         """, (excess,))
-        self._db.commit()
+        self._clear_recall_cache()
+        self._refresh_stats()
 
+    @_serialized
     def decay_importance(self) -> int:
         """
         Apply importance decay to all memories.
@@ -378,32 +1088,39 @@ class MemoryEngine:
         Returns:
             Number of memories updated
         """
-        cursor = self._db.cursor()
+        # Rows already at the floor are skipped, so once most memories have
+        # decayed this range-scans idx_importance and rewrites few pages
+        cursor = self._cursor
         cursor.execute("""
             UPDATE memories
             SET importance = MAX(importance - ?, ?)
-        """, (self.config.decay_rate, self.config.min_importance))
+            WHERE importance > ?
+        """, (self.config.decay_rate, self.config.min_importance,
+              self.config.min_importance))
 
         affected = cursor.rowcount
-        self._db.commit()
+        if affected:
+            self._clear_recall_cache()
+            self._refresh_stats()
 
         return affected
 
     def get_stats(self) -> Dict[str, Any]:
         """Get memory statistics."""
-        cursor = self._db.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM memories")
-        total = cursor.fetchone()[0]
-
-        cursor.execute("SELECT AVG(importance) FROM memories")
-        avg_importance = cursor.fetchone()[0] or 0
-
-        cursor.execute("SELECT SUM(access_count) FROM memories")
-        total_accesses = cursor.fetchone()[0] or 0
-
-        # Database file size
-        db_size = os.path.getsize(self.config.storage_path) if os.path.exists(self.config.storage_path) else 0
+        with self._lock:
+            total = self._stat_count
+            avg_importance = self._stat_imp_sum / total if total else 0
+            total_accesses = self._stat_access_sum
+
+        # Database file size, re-stat'ed at most once a second
+        checked_at, db_size = self._db_size_cache
+        now = time.monotonic()
+        if now - checked_at >= 1.0:
+            try:
+                db_size = os.stat(self.config.storage_path).st_size
+            except OSError:
+                db_size = 0
+            self._db_size_cache = (now, db_size)
 
         return {
             "total_memories": total,
@@ -416,51 +1133,87 @@ class MemoryEngine:
 
     def export(self, output_path: str) -> int:
         """Export all memories to JSON file."""
-        cursor = self._db.cursor()
-        cursor.execute("SELECT * FROM memories ORDER BY created_at DESC")
-
-        memories = []
-        for row in cursor.fetchall():
-            memories.append({
-                "id": row["id"],
-                "content": row["content"],
-                "created_at": row["created_at"],
-                "importance": row["importance"],
-                "tags": json.loads(row["tags"]),
-                "metadata": json.loads(row["metadata"]),
-                "access_count": row["access_count"],
-                "last_accessed": row["last_accessed"],
-            })
-
-        with open(output_path, "w") as f:
-            json.dump({"memories": memories, "exported_at": time.time()}, f, indent=2)
-
-        return len(memories)
+        self._flush_access()
+        with self._reading():
+            cursor = self._cursor
+            cursor.execute("SELECT * FROM memories ORDER BY created_at DESC")
+
+            # Stream rows straight to disk; tags and metadata are already stored
+            # as JSON text and are written through without a decode/encode trip
+            dumps = _json_dumps
+            count = 0
+            with open(output_path, "w") as f:
+                f.write('{"memories": [')
+                for row in cursor:
+                    if count:
+                        f.write(", ")
+                    f.write(
+                        f'{{"id": {dumps(row["id"])}, '
+                        f'"content": {dumps(row["content"])}, '
+                        f'"created_at": {dumps(row["created_at"])}, '
+                        f'"importance": {dumps(row["importance"])}, '
+                        f'"tags": {row["tags"]}, '
+                        f'"metadata": {row["metadata"]}, '
+                        f'"access_count": {dumps(row["access_count"])}, '
+                        f'"last_accessed": {dumps(row["last_accessed"])}}}'
+                    )
+                    count += 1
+                f.write(f'], "exported_at": {dumps(time.time())}}}')
+
+        return count
 
+    @_serialized
     def import_memories(self, input_path: str) -> int:
-        """Import memories from JSON file."""
+        """Import memories from JSON file in a single batched transaction."""
         with open(input_path, "r") as f:
-            data = json.load(f)
+            data = _json_loads(f.read())
 
         memories = data.get("memories", [])
-        count = 0
-
-        for m in memories:
-            self.add(
-                content=m["content"],
-                importance=m.get("importance", self.config.default_importance),
-                tags=m.get("tags", []),
-                metadata=m.get("metadata", {}),
+        if not memories:
+            return 0
+
+        # Build all rows up front and write them in one transaction
+        now = time.time()
+        rows = [
+            (
+                # Index keeps IDs unique for duplicate content in one batch
+                self._generate_id(f"{m['content']}{i}"),
+                m["content"],
+                now,
+                m.get("importance") or self.config.default_importance,
+                _json_dumps(m.get("tags") or []),
+                _json_dumps(m.get("metadata") or {}),
+                0,
+                None,
             )
-            count += 1
+            for i, m in enumerate(memories)
+        ]
 
-        return count
+        self._insert_rows(rows)
+        self._refresh_stats()
+
+        # Enforce max memories limit once for the whole batch
+        self._enforce_limit()
+
+        return len(rows)
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            self._db.close()
-            self._db = None
+        """Stop the writer thread and close every connection."""
+        if self._writer is None:
+            return
+        self._flush_access()
+        self._write_queue.put(None)
+        self._writer.join()
+        self._writer = None
+        self._finalizer.detach()
+        _open_engines.discard(self)
+
+        with self._lock:
+            for db in self._connections.values():
+                db.close()
+            self._connections.clear()
+            self._local = threading.local()
+            self._clear_recall_cache()
 
     def __enter__(self) -> "MemoryEngine":
         return self
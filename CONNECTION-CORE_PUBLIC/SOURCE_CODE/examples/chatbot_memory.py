@@ -6,6 +6,7 @@ Chatbot with Memory Example
 Demonstrates how to add persistent memory to a chatbot.
 """
 
+import re
 import sys
 sys.path.insert(0, '..')
 
@@ -13,6 +14,23 @@ from connection_core import MemoryEngine, MemoryConfig
 from memory_engine import ConversationMemory, SemanticMemory
 
 
+# A clause starts the message or follows punctuation, "and" or "but";
+# it ends at punctuation or where the sentence goes on
+CLAUSE_START = r"(?:^|(?<=[.,;!?])|(?<=\band)|(?<=\bbut))\s*"
+CLAUSE_END = r"(?=\s+(?:and|but)\b|[.,;!?]|$)"
+
+# "my name is" only counts at the start of a clause ("...when my name is said")
+NAME_PATTERN = CLAUSE_START + r"my name is\s+(?P<name>[^.,;!?]+?)" + CLAUSE_END
+
+# User info worth remembering, found in a single scan of each message
+USER_INFO_RE = re.compile(
+    NAME_PATTERN + r"|\bi (?:prefer|like)\s+(?P<preference>[^.,;!?]+?)" + CLAUSE_END,
+    re.IGNORECASE,
+)
+# The phrases above, which process_message already stores as concepts
+USER_INFO_PHRASE_RE = re.compile(r"my name is|i (?:prefer|like)", re.IGNORECASE)
+
+
 def create_chatbot_with_memory():
     """Create a chatbot with persistent memory."""
 
@@ -37,17 +55,22 @@ def process_message(
 ) -> str:
     """Process a user message and generate response."""
 
-    # Add user message to conversation
-    conversation.add_turn("user", message)
-
     # Check for user info updates
-    if "my name is" in message.lower():
-        name = message.split("my name is")[-1].strip().rstrip(".")
-        semantic.add_concept("user.name", name, importance=0.9)
-
-    if "i prefer" in message.lower() or "i like" in message.lower():
-        pref = message.split("prefer" if "prefer" in message.lower() else "like")[-1].strip()
-        semantic.add_concept("user.preferences.mentioned", pref, importance=0.8)
+    user_info = list(USER_INFO_RE.finditer(message))
+    for match in user_info:
+        if match.group("name"):
+            name = match.group("name").strip()
+            semantic.add_concept("user.name", name, importance=0.9)
+        else:
+            pref = match.group("preference").strip()
+            semantic.add_concept("user.preferences.mentioned", pref, importance=0.8)
+
+    # Add user message to conversation. A name or preference is already
+    # stored as a concept, so extract only if the message states more
+    extract = None
+    if user_info and not conversation.has_fact(USER_INFO_PHRASE_RE.sub(" ", message)):
+        extract = False
+    conversation.add_turn("user", message, extract=extract)
 
     # Recall relevant memories for context
     relevant = conversation.search(message, limit=3)
@@ -56,36 +79,51 @@ def process_message(
     response = generate_response(message, relevant, semantic)
 
     # Add assistant response to conversation
-    conversation.add_turn("assistant", response)
+    conversation.add_turn("assistant", response, extract=False)
 
     return response
 
 
-def generate_response(message: str, relevant_memories, semantic: SemanticMemory) -> str:
-    """Generate a response (placeholder - would use LLM in production)."""
+def _greet(match, relevant_memories, semantic: SemanticMemory) -> str:
+    user_name = semantic.get_concept("user.name")
+    if user_name:
+        return f"Hello {user_name}! How can I help you today?"
+    return "Hello! What's your name?"
+
 
-    # Check if we know the user's name
+def _introduce(match, relevant_memories, semantic: SemanticMemory) -> str:
+    name = match.group("name").strip()
+    return f"Nice to meet you, {name}! I'll remember that."
+
+
+def _recall_name(match, relevant_memories, semantic: SemanticMemory) -> str:
     user_name = semantic.get_concept("user.name")
+    if user_name:
+        return f"Your name is {user_name}!"
+    return "I don't think you've told me your name yet."
 
-    # Simple pattern matching for demo
-    message_lower = message.lower()
 
-    if "hello" in message_lower or "hi" in message_lower:
-        if user_name:
-            return f"Hello {user_name}! How can I help you today?"
-        return "Hello! What's your name?"
+def _acknowledge(match, relevant_memories, semantic: SemanticMemory) -> str:
+    return "Got it! I've stored that in my memory."
 
-    if "my name is" in message_lower:
-        name = message.split("my name is")[-1].strip().rstrip(".")
-        return f"Nice to meet you, {name}! I'll remember that."
 
-    if "what is my name" in message_lower or "do you know my name" in message_lower:
-        if user_name:
-            return f"Your name is {user_name}!"
-        return "I don't think you've told me your name yet."
+# Intent patterns in priority order; the first one that matches answers
+INTENTS = [
+    (re.compile(r"hello|hi", re.IGNORECASE), _greet),
+    (re.compile(NAME_PATTERN, re.IGNORECASE), _introduce),
+    (re.compile(r"what is my name|do you know my name", re.IGNORECASE), _recall_name),
+    (re.compile(r"remember", re.IGNORECASE), _acknowledge),
+]
 
-    if "remember" in message_lower:
-        return "Got it! I've stored that in my memory."
+
+def generate_response(message: str, relevant_memories, semantic: SemanticMemory) -> str:
+    """Generate a response (placeholder - would use LLM in production)."""
+
+    # Simple pattern matching for demo
+    for pattern, handler in INTENTS:
+        match = pattern.search(message)
+        if match:
+            return handler(match, relevant_memories, semantic)
 
     # Use relevant memories for context
     if relevant_memories:
@@ -112,10 +150,12 @@ def main():
             if not user_input:
                 continue
 
-            if user_input.lower() == "quit":
+            command = user_input.lower()
+
+            if command == "quit":
                 break
 
-            if user_input.lower() == "stats":
+            if command == "stats":
                 stats = engine.get_stats()
                 print(f"\nMemory Stats:")
                 print(f"  Total memories: {stats['total_memories']}")
@@ -123,7 +163,7 @@ def main():
                 print()
                 continue
 
-            if user_input.lower() == "history":
+            if command == "history":
                 print("\nRecent conversation:")
                 print(conversation.get_formatted(5))
                 print()
@@ -80,20 +80,22 @@ def search_research(engine: MemoryEngine, query: str, limit: int = 10):
 
     memories = engine.recall(query, limit=limit)
 
-    print(f"\nSearch results for '{query}':")
-    print("-" * 50)
+    # Build the whole report and write it once
+    lines = ["", f"Search results for '{query}':", "-" * 50]
 
     for m in memories:
         mem_type = m.metadata.get("type", "unknown")
         source = m.metadata.get("source", "")
         topic = m.metadata.get("topic", "")
 
-        print(f"[{mem_type.upper()}] (topic: {topic})")
-        print(f"  {m.content}")
+        lines.append(f"[{mem_type.upper()}] (topic: {topic})")
+        lines.append(f"  {m.content}")
         if source:
-            print(f"  Source: {source}")
-        print(f"  Importance: {m.importance:.2f}")
-        print()
+            lines.append(f"  Source: {source}")
+        lines.append(f"  Importance: {m.importance:.2f}")
+        lines.append("")
+
+    print("\n".join(lines))
 
 
 def get_topic_summary(engine: MemoryEngine, topic: str):
@@ -109,26 +111,26 @@ def get_topic_summary(engine: MemoryEngine, topic: str):
     questions = [m for m in memories if m.metadata.get("type") == "question"]
     hypotheses = [m for m in memories if m.metadata.get("type") == "hypothesis"]
 
-    print(f"\n=== Topic Summary: {topic} ===")
+    # Build the whole summary and write it once
+    lines = ["", f"=== Topic Summary: {topic} ==="]
 
     if hypotheses:
-        print(f"\nHypotheses ({len(hypotheses)}):")
-        for h in hypotheses:
-            print(f"  - {h.content}")
+        lines.append(f"\nHypotheses ({len(hypotheses)}):")
+        lines.extend(f"  - {h.content}" for h in hypotheses)
 
     if findings:
-        print(f"\nFindings ({len(findings)}):")
+        lines.append(f"\nFindings ({len(findings)}):")
         for f in findings:
-            print(f"  - {f.content}")
+            lines.append(f"  - {f.content}")
             if f.metadata.get("source"):
-                print(f"    (Source: {f.metadata['source']})")
+                lines.append(f"    (Source: {f.metadata['source']})")
 
     if questions:
-        print(f"\nOpen Questions ({len(questions)}):")
-        for q in questions:
-            print(f"  - {q.content}")
+        lines.append(f"\nOpen Questions ({len(questions)}):")
+        lines.extend(f"  - {q.content}" for q in questions)
 
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
 def main():
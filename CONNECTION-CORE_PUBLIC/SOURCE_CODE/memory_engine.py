@@ -6,12 +6,49 @@ Extended memory functionality for Connection-Core.
 """
 
 import json
+import re
+import sys
 import time
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
-from collections import deque
+from collections import OrderedDict, deque
+from itertools import islice
 
-from .connection_core import MemoryEngine, Memory, MemoryConfig
+from .connection_core import MemoryEngine, Memory, MemoryConfig, _json_dumps, _json_loads
+
+
+# Simple fact extraction patterns, matched in a single scan
+_FACT_PATTERNS = [
+    "my name is",
+    "i am",
+    "i prefer",
+    "i like",
+    "i don't like",
+    "i want",
+    "remember that",
+    "note that",
+]
+_FACT_RE = re.compile("|".join(map(re.escape, _FACT_PATTERNS)), re.IGNORECASE)
+
+# Tags stored on every turn/concept; interned so cached copies share one object
+_TAG_CONVERSATION = sys.intern("conversation")
+_TAG_CONCEPT = sys.intern("concept")
+
+
+@lru_cache(maxsize=64)
+def _role_tag(role: str) -> str:
+    """Interned "role:<role>" tag."""
+    return sys.intern(f"role:{role}")
+
+
+@lru_cache(maxsize=8192)
+def _concept_tags(path: str) -> Tuple[str, ...]:
+    """Interned tags for a concept path: concept, path and one per level."""
+    parts = path.split(".")
+    return (_TAG_CONCEPT, sys.intern(f"path:{path}")) + tuple(
+        sys.intern(f"level{i}:{p}") for i, p in enumerate(parts)
+    )
 
 
 @dataclass
@@ -54,27 +91,49 @@ class ConversationMemory:
         self.engine = engine
         self.max_turns = max_turns
         self.auto_extract = auto_extract
-        self._turns: deque = deque(maxlen=max_turns)
+        # Turns are stored column-wise in parallel bounded deques, so
+        # formatting and recency scans walk flat sequences of strings
+        self._roles: deque = deque(maxlen=max_turns)
+        self._contents: deque = deque(maxlen=max_turns)
+        self._timestamps: deque = deque(maxlen=max_turns)
+        self._metadata: deque = deque(maxlen=max_turns)
         self._load_history()
 
+    def _append(self, turn: ConversationTurn) -> None:
+        """Append a turn to the column store."""
+        self._roles.append(turn.role)
+        self._contents.append(turn.content)
+        self._timestamps.append(turn.timestamp)
+        self._metadata.append(turn.metadata)
+
+    def _recent_start(self, count: int) -> int:
+        """Index of the first of the last `count` turns."""
+        total = len(self._roles)
+        return total - count if 0 < count < total else 0
+
     def _load_history(self) -> None:
         """Load conversation history from storage."""
-        memories = self.engine.recall("conversation:history", limit=self.max_turns)
-        for memory in reversed(memories):  # Oldest first
-            if memory.metadata.get("type") == "conversation_turn":
+        # Plain recency query on the conversation tag, not a text search
+        # Shallow rows skip the tag and access columns turns never use
+        rows = self.engine.get_recent_by_tag(
+            _TAG_CONVERSATION, limit=self.max_turns, shallow=True
+        )
+        for _, content, created_at, metadata in reversed(rows):  # Oldest first
+            if metadata.get("type") == "conversation_turn":
                 turn = ConversationTurn(
-                    role=memory.metadata.get("role", "unknown"),
-                    content=memory.content,
-                    timestamp=memory.created_at,
-                    metadata=memory.metadata,
+                    role=sys.intern(metadata.get("role", "unknown")),
+                    content=content,
+                    timestamp=created_at,
+                    metadata=metadata,
                 )
-                self._turns.append(turn)
+                self._append(turn)
 
     def add_turn(
         self,
         role: str,
         content: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        extract: Optional[bool] = None
     ) -> ConversationTurn:
         """
         Add a conversation turn.
@@ -83,16 +142,19 @@ class ConversationMemory:
             role: The speaker role ("user", "assistant", "system")
             content: The message content
             metadata: Optional additional data
+            extract: Override auto_extract for this turn, e.g. when the
+                caller has already stored the facts it cares about
 
         Returns:
             The created ConversationTurn
         """
+        role = sys.intern(role)
         turn = ConversationTurn(
             role=role,
             content=content,
             metadata=metadata or {},
         )
-        self._turns.append(turn)
+        self._append(turn)
 
         # Store in memory engine
         turn_metadata = {
@@ -104,46 +166,48 @@ class ConversationMemory:
         self.engine.add(
             content=content,
             importance=0.3,  # Conversation turns have lower base importance
-            tags=["conversation", f"role:{role}"],
+            tags=[_TAG_CONVERSATION, _role_tag(role)],
             metadata=turn_metadata,
         )
 
         # Auto-extract important facts
-        if self.auto_extract:
+        if self.auto_extract if extract is None else extract:
             self._extract_facts(content, role)
 
         return turn
 
+    @staticmethod
+    def has_fact(text: str) -> bool:
+        """Whether auto-extraction would store `text` as a fact."""
+        return _FACT_RE.search(text) is not None
+
     def _extract_facts(self, content: str, role: str) -> None:
         """Extract and store important facts from content."""
-        # Simple fact extraction patterns
-        important_patterns = [
-            "my name is",
-            "i am",
-            "i prefer",
-            "i like",
-            "i don't like",
-            "i want",
-            "remember that",
-            "note that",
-        ]
-
-        content_lower = content.lower()
-        for pattern in important_patterns:
-            if pattern in content_lower:
-                # Store as high-importance fact
-                self.engine.add(
-                    content=content,
-                    importance=0.8,
-                    tags=["fact", "extracted", f"source:{role}"],
-                    metadata={"extracted_from": "conversation", "pattern": pattern},
-                )
-                break
+        match = _FACT_RE.search(content)
+        if match:
+            # Store as high-importance fact
+            self.engine.add(
+                content=content,
+                importance=0.8,
+                tags=["fact", "extracted", f"source:{role}"],
+                metadata={
+                    "extracted_from": "conversation",
+                    "pattern": match.group(0).lower(),
+                },
+            )
 
     def get_recent(self, count: int = 10) -> List[ConversationTurn]:
         """Get most recent conversation turns."""
-        turns = list(self._turns)
-        return turns[-count:] if len(turns) > count else turns
+        start = self._recent_start(count)
+        return [
+            ConversationTurn(role=role, content=content, timestamp=ts, metadata=meta)
+            for role, content, ts, meta in zip(
+                islice(self._roles, start, None),
+                islice(self._contents, start, None),
+                islice(self._timestamps, start, None),
+                islice(self._metadata, start, None),
+            )
+        ]
 
     def get_formatted(
         self,
@@ -151,17 +215,21 @@ class ConversationMemory:
         format_template: str = "{role}: {content}"
     ) -> str:
         """Get formatted conversation history."""
-        turns = self.get_recent(count)
+        start = self._recent_start(count)
         lines = [
-            format_template.format(role=t.role.capitalize(), content=t.content)
-            for t in turns
+            format_template.format(role=role.capitalize(), content=content)
+            for role, content in zip(
+                islice(self._roles, start, None),
+                islice(self._contents, start, None),
+            )
         ]
         return "\n".join(lines)
 
     def clear(self) -> int:
         """Clear conversation history."""
-        count = len(self._turns)
-        self._turns.clear()
+        count = len(self._roles)
+        for column in (self._roles, self._contents, self._timestamps, self._metadata):
+            column.clear()
         return count
 
     def search(self, query: str, limit: int = 5) -> List[ConversationTurn]:
@@ -169,14 +237,14 @@ class ConversationMemory:
         memories = self.engine.recall(
             query,
             limit=limit,
-            tags=["conversation"]
+            tags=[_TAG_CONVERSATION]
         )
 
         turns = []
         for memory in memories:
             if memory.metadata.get("type") == "conversation_turn":
                 turns.append(ConversationTurn(
-                    role=memory.metadata.get("role", "unknown"),
+                    role=sys.intern(memory.metadata.get("role", "unknown")),
                     content=memory.content,
                     timestamp=memory.created_at,
                     metadata=memory.metadata,
@@ -198,15 +266,38 @@ class SemanticMemory:
         >>> theme = semantic.get_concept("user.preferences.theme")
     """
 
-    def __init__(self, engine: MemoryEngine):
+    def __init__(self, engine: MemoryEngine, cache_size: int = 1024):
         """
         Initialize semantic memory.
 
         Args:
             engine: The memory engine to use
+            cache_size: Most recently used concepts kept in memory
         """
         self.engine = engine
-        self._concept_cache: Dict[str, Memory] = {}
+        self.cache_size = cache_size
+        self._concept_cache: "OrderedDict[str, Memory]" = OrderedDict()
+        self._legacy_migrated = False
+
+    def _migrate_legacy_concepts(self) -> None:
+        """Give concepts stored before path tags existed their path tags."""
+        self._legacy_migrated = True
+        tagged = set(self.engine.list_tags("path:", with_tag=_TAG_CONCEPT))
+        concepts = self.engine.get_recent_by_tag(
+            _TAG_CONCEPT, limit=self.engine.count(), shallow=True
+        )
+        for memory_id, _, _, metadata in concepts:
+            path = metadata.get("path")
+            if path and f"path:{path}" not in tagged:
+                self.engine.update(memory_id, tags=list(_concept_tags(path)))
+                tagged.add(f"path:{path}")
+
+    def _cache_concept(self, path: str, memory: Memory) -> None:
+        """Cache a concept, evicting the least recently used one."""
+        self._concept_cache[path] = memory
+        self._concept_cache.move_to_end(path)
+        if len(self._concept_cache) > self.cache_size:
+            self._concept_cache.popitem(last=False)
 
     def add_concept(
         self,
@@ -226,16 +317,14 @@ class SemanticMemory:
             The created/updated Memory
         """
         # Store as JSON if not string
-        content = value if isinstance(value, str) else json.dumps(value)
-
-        # Parse path for tags
-        parts = path.split(".")
-        tags = ["concept"] + [f"level{i}:{p}" for i, p in enumerate(parts)]
+        content = value if isinstance(value, str) else _json_dumps(value)
 
+        # Tags come from the path; the path tag gives get_concept an exact,
+        # indexed lookup
         memory = self.engine.add(
             content=content,
             importance=importance,
-            tags=tags,
+            tags=list(_concept_tags(path)),
             metadata={
                 "type": "concept",
                 "path": path,
@@ -243,7 +332,7 @@ class SemanticMemory:
             },
         )
 
-        self._concept_cache[path] = memory
+        self._cache_concept(path, memory)
         return memory
 
     def get_concept(self, path: str) -> Optional[Any]:
@@ -257,21 +346,35 @@ class SemanticMemory:
             The concept value or None
         """
         # Check cache first
-        if path in self._concept_cache:
-            memory = self._concept_cache[path]
+        memory = self._concept_cache.get(path)
+        if memory is not None:
+            self._concept_cache.move_to_end(path)
             return self._parse_value(memory)
 
-        # Search in engine
+        memory = self._find_concept(path)
+        if memory is None:
+            return None
+
+        self._cache_concept(path, memory)
+        return self._parse_value(memory)
+
+    def _find_concept(self, path: str) -> Optional[Memory]:
+        """Look a concept up in the engine."""
+        # Exact lookup through the path tag index
+        memories = self.engine.recall("", limit=1, tags=[f"path:{path}"])
+        if memories:
+            return memories[0]
+
+        # Concepts stored before path tags existed
         memories = self.engine.recall(
             path,
             limit=1,
-            tags=["concept"]
+            tags=[_TAG_CONCEPT]
         )
 
         for memory in memories:
             if memory.metadata.get("path") == path:
-                self._concept_cache[path] = memory
-                return self._parse_value(memory)
+                return memory
 
         return None
 
@@ -283,32 +386,29 @@ class SemanticMemory:
             return memory.content
         else:
             try:
-                return json.loads(memory.content)
+                return _json_loads(memory.content)
             except json.JSONDecodeError:
                 return memory.content
 
     def list_concepts(self, prefix: str = "") -> List[str]:
         """List all concept paths with given prefix."""
-        memories = self.engine.recall(
-            prefix or "concept",
-            limit=100,
-            tags=["concept"]
-        )
-
-        paths = []
-        for memory in memories:
-            path = memory.metadata.get("path", "")
-            if path.startswith(prefix):
-                paths.append(path)
-
-        return sorted(set(paths))
+        if not self._legacy_migrated:
+            self._migrate_legacy_concepts()
+
+        # Path tags are range-scanned off the tag index, so this no longer
+        # depends on full-text matching or a fixed result limit
+        return [
+            tag[len("path:"):]
+            for tag in self.engine.list_tags(f"path:{prefix}", with_tag=_TAG_CONCEPT)
+        ]
 
     def delete_concept(self, path: str) -> bool:
         """Delete a concept."""
-        if path in self._concept_cache:
-            memory = self._concept_cache.pop(path)
-            return self.engine.delete(memory.id)
-        return False
+        # Evicted concepts are looked up again rather than treated as missing
+        memory = self._concept_cache.pop(path, None) or self._find_concept(path)
+        if memory is None:
+            return False
+        return self.engine.delete(memory.id)
 
     def get_related(self, path: str, limit: int = 5) -> List[Tuple[str, Any]]:
         """Get concepts related to a path."""
@@ -319,13 +419,26 @@ class SemanticMemory:
         else:
             parent = path
 
-        related = []
-        for concept_path in self.list_concepts(parent):
-            if concept_path != path:
-                value = self.get_concept(concept_path)
-                related.append((concept_path, value))
+        paths = [p for p in self.list_concepts(parent) if p != path][:limit]
+
+        # Fetch every uncached concept in one tag query instead of one
+        # lookup per path
+        missing = [p for p in paths if p not in self._concept_cache]
+        if missing:
+            found: Dict[str, Memory] = {}
+            memories = self.engine.recall(
+                "",
+                limit=len(missing),
+                tags=[f"path:{p}" for p in missing]
+            )
+            for memory in memories:
+                found.setdefault(memory.metadata.get("path"), memory)
+            for concept_path in missing:
+                memory = found.get(concept_path) or self._find_concept(concept_path)
+                if memory is not None:
+                    self._cache_concept(concept_path, memory)
 
-        return related[:limit]
+        return [(p, self.get_concept(p)) for p in paths]
 
 
 class WorkingMemory:
@@ -382,28 +495,26 @@ class WorkingMemory:
 
     def persist(self, importance: float = 0.6) -> int:
         """Persist working memory to long-term storage."""
-        count = 0
-
-        # Save context items
-        for key, value in self._context.items():
-            self.engine.add(
-                content=f"{key}: {value}",
-                importance=importance,
-                tags=["working_memory", "context"],
-                metadata={"key": key, "value": value},
-            )
-            count += 1
-
-        # Save notes
-        for note in self._notes:
-            self.engine.add(
-                content=note,
-                importance=importance,
-                tags=["working_memory", "note"],
-            )
-            count += 1
+        # Context items and notes are written in one batch
+        records = [
+            {
+                "content": f"{key}: {value}",
+                "importance": importance,
+                "tags": ["working_memory", "context"],
+                "metadata": {"key": key, "value": value},
+            }
+            for key, value in self._context.items()
+        ]
+        records += [
+            {
+                "content": note,
+                "importance": importance,
+                "tags": ["working_memory", "note"],
+            }
+            for note in self._notes
+        ]
 
-        return count
+        return len(self.engine.add_many(records))
 
     def clear(self) -> None:
         """Clear working memory."""
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Chatbot Example Tests
+=====================
+
+Tests for the chatbot memory example.
+"""
+
+import sys
+import unittest
+
+sys.path.insert(0, '../..')
+sys.path.insert(0, '../examples')
+
+from SOURCE_CODE import connection_core, memory_engine
+
+# The example imports the engine modules by their top-level names
+sys.modules.setdefault("connection_core", connection_core)
+sys.modules.setdefault("memory_engine", memory_engine)
+
+import chatbot_memory
+
+
+class TestChatbotMemory(unittest.TestCase):
+    """Tests for process_message."""
+
+    def setUp(self):
+        self.engine = connection_core.MemoryEngine(
+            connection_core.MemoryConfig(storage_path=":memory:")
+        )
+        self.conversation = memory_engine.ConversationMemory(self.engine)
+        self.semantic = memory_engine.SemanticMemory(self.engine)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def send(self, message):
+        return chatbot_memory.process_message(message, self.conversation, self.semantic)
+
+    def test_name(self):
+        """Test that a stated name is stored and recalled."""
+        self.assertEqual(self.send("My name is Alice."), "Nice to meet you, Alice! I'll remember that.")
+        self.assertEqual(self.semantic.get_concept("user.name"), "Alice")
+
+    def test_name_and_preference(self):
+        """Test that a name doesn't swallow the rest of the sentence."""
+        self.send("my name is Bob and I like tea")
+
+        self.assertEqual(self.semantic.get_concept("user.name"), "Bob")
+        self.assertEqual(self.semantic.get_concept("user.preferences.mentioned"), "tea")
+
+    def test_preference_then_name(self):
+        """Test that a preference doesn't swallow a name after it."""
+        self.assertEqual(self.send("i like tea and my name is Bob"), "Nice to meet you, Bob! I'll remember that.")
+
+        self.assertEqual(self.semantic.get_concept("user.name"), "Bob")
+        self.assertEqual(self.semantic.get_concept("user.preferences.mentioned"), "tea")
+
+    def test_name_phrase_mid_clause(self):
+        """Test that "my name is" inside a clause isn't an introduction."""
+        self.assertNotIn("Nice to meet you", self.send("I like it when my name is said"))
+        self.assertIsNone(self.semantic.get_concept("user.name"))
+
+    def facts(self):
+        return self.engine.get_recent_by_tag("fact", limit=10)
+
+    def test_name_not_stored_as_fact(self):
+        """Test that a name alone isn't also extracted as a fact."""
+        self.send("My name is Alice.")
+        self.assertEqual(self.facts(), [])
+
+    def test_other_facts_still_extracted(self):
+        """Test that a name doesn't stop other facts being extracted."""
+        message = "my name is Bob, remember that my flight is at 9"
+        self.send(message)
+
+        self.assertEqual(self.semantic.get_concept("user.name"), "Bob")
+        self.assertEqual([m.content for m in self.facts()], [message])
+
+
+if __name__ == "__main__":
+    unittest.main()
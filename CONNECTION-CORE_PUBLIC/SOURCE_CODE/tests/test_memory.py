@@ -6,33 +6,49 @@ Connection-Core Test Suite
 Tests for the memory engine.
 """
 
+import gc
+import json
 import os
 import sys
+import shutil
+import sqlite3
+import subprocess
 import tempfile
+import threading
 import unittest
+import weakref
+from unittest import mock
 
 sys.path.insert(0, '..')
 
 from connection_core import MemoryEngine, Memory, MemoryConfig
 
+sys.path.insert(0, '../..')
+
+from SOURCE_CODE.memory_engine import SemanticMemory
+
 
 class TestMemoryEngine(unittest.TestCase):
     """Tests for MemoryEngine."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_memory.db")
+    @classmethod
+    def setUpClass(cls):
+        """Open one engine for the whole class."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.temp_dir, "test_memory.db")
 
-        config = MemoryConfig(storage_path=self.db_path)
-        self.engine = MemoryEngine(config)
+        config = MemoryConfig(storage_path=cls.db_path)
+        cls.engine = MemoryEngine(config)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up."""
-        self.engine.close()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        cls.engine.close()
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Start every test from an empty store."""
+        self.engine.clear()
 
     def test_add_memory(self):
         """Test adding a memory."""
@@ -67,6 +83,19 @@ class TestMemoryEngine(unittest.TestCase):
         self.assertGreater(len(results), 0)
         self.assertTrue(any("Python" in m.content for m in results))
 
+    def test_add_many(self):
+        """Test adding memories in one batch."""
+        memories = self.engine.add_many([
+            {"content": "First note", "tags": ["note"]},
+            {"content": "Second note", "importance": 0.9},
+        ])
+
+        self.assertEqual(len(memories), 2)
+        self.assertEqual(memories[0].tags, ["note"])
+        self.assertEqual(memories[1].importance, 0.9)
+        self.assertEqual(self.engine.count(), 2)
+        self.assertEqual(self.engine.get(memories[0].id).content, "First note")
+
     def test_get_memory(self):
         """Test getting a specific memory."""
         original = self.engine.add("Unique content")
@@ -76,6 +105,15 @@ class TestMemoryEngine(unittest.TestCase):
         self.assertEqual(retrieved.id, original.id)
         self.assertEqual(retrieved.content, original.content)
 
+    def test_get_many(self):
+        """Test getting several memories at once."""
+        first = self.engine.add("First")
+        second = self.engine.add("Second")
+
+        memories = self.engine.get_many([second.id, "missing", first.id])
+
+        self.assertEqual([m.content for m in memories], ["Second", "First"])
+
     def test_update_memory(self):
         """Test updating a memory."""
         memory = self.engine.add("Original content")
@@ -148,7 +186,7 @@ class TestMemoryEngine(unittest.TestCase):
     def test_max_memories_limit(self):
         """Test that max memories limit is enforced."""
         config = MemoryConfig(
-            storage_path=self.db_path,
+            storage_path=os.path.join(self.temp_dir, "limited.db"),
             max_memories=5
         )
         engine = MemoryEngine(config)
@@ -174,17 +212,20 @@ class TestMemoryEngine(unittest.TestCase):
 class TestMemoryOperations(unittest.TestCase):
     """Additional memory operation tests."""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_memory.db")
-        config = MemoryConfig(storage_path=self.db_path)
-        self.engine = MemoryEngine(config)
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.temp_dir, "test_memory.db")
+        config = MemoryConfig(storage_path=cls.db_path)
+        cls.engine = MemoryEngine(config)
 
-    def tearDown(self):
-        self.engine.close()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.close()
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        self.engine.clear()
 
     def test_search_relevance(self):
         """Test that search returns relevant results."""
@@ -218,6 +259,224 @@ class TestMemoryOperations(unittest.TestCase):
         result = self.engine.delete("nonexistent_id")
         self.assertFalse(result)
 
+    def test_list_tags(self):
+        """Test listing tags by prefix."""
+        self.engine.add("First", tags=["path:user.name", "concept"])
+        self.engine.add("Second", tags=["path:user.theme", "path:project"])
+
+        self.assertEqual(
+            self.engine.list_tags("path:user."),
+            ["path:user.name", "path:user.theme"]
+        )
+        self.assertIn("concept", self.engine.list_tags())
+
+    def test_get_recent_by_tag(self):
+        """Test fetching the newest memories for a tag."""
+        for i in range(4):
+            self.engine.add(f"Turn {i}", tags=["conversation"])
+        self.engine.add("Unrelated")
+
+        recent = self.engine.get_recent_by_tag("conversation", limit=2)
+
+        self.assertEqual([m.content for m in recent], ["Turn 3", "Turn 2"])
+
+        shallow = self.engine.get_recent_by_tag("conversation", limit=1, shallow=True)
+        self.assertEqual(shallow[0][:2], (recent[0].id, "Turn 3"))
+        self.assertEqual(shallow[0][3], {})
+
+    def test_recall_cache_hit(self):
+        """Test that a repeated recall is served from the cache."""
+        self.engine.add("Cached fact", tags=["a"])
+        first = self.engine.recall("cached fact")
+
+        with mock.patch.object(self.engine, "_search") as search:
+            second = self.engine.recall("  Cached   FACT ")
+        search.assert_not_called()
+        self.assertEqual([m.id for m in second], [m.id for m in first])
+
+        # Hits are fresh objects, so caller mutations don't leak back
+        second[0].tags.append("mutated")
+        second[0].metadata["mutated"] = True
+        third = self.engine.recall("cached fact")
+        self.assertEqual(third[0].tags, ["a"])
+        self.assertEqual(third[0].metadata, {})
+        self.assertEqual(third[0].access_count, 2)
+
+    def test_reads_count_pending_access(self):
+        """Test that get, get_many and export include buffered accesses."""
+        memory = self.engine.add("Pending access fact")
+        self.engine.recall("pending access")
+        self.engine.recall("pending access")
+
+        self.assertEqual(self.engine.get(memory.id).access_count, 2)
+        self.assertEqual(self.engine.get_many([memory.id])[0].access_count, 2)
+
+        export_path = os.path.join(self.temp_dir, "pending_access.json")
+        self.engine.export(export_path)
+        with open(export_path) as f:
+            exported = json.load(f)["memories"]
+        self.assertEqual(
+            [m["access_count"] for m in exported if m["id"] == memory.id], [2]
+        )
+
+    def test_recall_cache_invalidated_on_write(self):
+        """Test that a write drops cached recalls."""
+        self.engine.add("Invalidation fact")
+        self.assertEqual(len(self.engine.recall("invalidation")), 1)
+
+        self.engine.add("Another invalidation fact")
+        self.assertEqual(len(self.engine.recall("invalidation")), 2)
+
+    def test_recall_cache_ttl(self):
+        """Test that cached recalls expire."""
+        self.engine.add("Expiring fact")
+        self.engine.recall("expiring")
+
+        with mock.patch.object(self.engine.config, "recall_cache_ttl", 0), \
+                mock.patch.object(self.engine, "_search", return_value=[]) as search:
+            self.assertEqual(self.engine.recall("expiring"), [])
+        search.assert_called_once()
+
+
+class TestSemanticMemory(unittest.TestCase):
+    """Tests for SemanticMemory."""
+
+    def setUp(self):
+        self.engine = MemoryEngine(MemoryConfig(storage_path=":memory:"))
+        self.semantic = SemanticMemory(self.engine)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_list_concepts(self):
+        """Test listing concepts, including ones stored before path tags."""
+        self.semantic.add_concept("user.name", "Alice")
+        self.semantic.add_concept("user.theme", "dark")
+        self.semantic.add_concept("project.name", "Core")
+        # A concept from before path tags existed
+        self.engine.add(
+            "en",
+            tags=["concept"],
+            metadata={"type": "concept", "path": "user.language", "value_type": "str"},
+        )
+        # Not a concept, though it carries a path tag
+        self.engine.add("Stray", tags=["path:user.stray"])
+
+        self.assertEqual(
+            self.semantic.list_concepts("user."),
+            ["user.language", "user.name", "user.theme"]
+        )
+        self.assertEqual(self.semantic.get_concept("user.language"), "en")
+
+
+class TestWriterThread(unittest.TestCase):
+    """Tests for the engine's writer thread."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        self.db_path = os.path.join(self.temp_dir, f"{self._testMethodName}.db")
+        self.engine = MemoryEngine(MemoryConfig(storage_path=self.db_path))
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_failing_write_in_batch(self):
+        """Test that a failing write is rolled back alone."""
+        def fail(engine):
+            engine.add("Never stored")
+            raise ValueError("boom")
+
+        first = self.engine._submit(MemoryEngine.add, "First")
+        failing = self.engine._submit(fail)
+        last = self.engine._submit(MemoryEngine.add, "Last")
+
+        with self.assertRaises(ValueError):
+            failing.result()
+        self.assertEqual(first.result().content, "First")
+        self.assertEqual(last.result().content, "Last")
+        self.assertEqual(self.engine.count(), 2)
+
+    def test_broken_batch_keeps_writer_alive(self):
+        """Test that a batch-level failure fails its writes, not the thread."""
+        def end_transaction(engine):
+            engine._cursor.execute("ROLLBACK")  # breaks the savepoint
+
+        with self.assertRaises(sqlite3.Error):
+            self.engine._submit(end_transaction).result()
+
+        self.engine.add("Still writable")
+        self.assertEqual(self.engine.count(), 1)
+
+    def test_concurrent_writers(self):
+        """Test that writes from many threads all land."""
+        def writer(n):
+            for i in range(25):
+                self.engine.add(f"Thread {n} memory {i}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.engine.count(), 100)
+
+    def test_use_after_close(self):
+        """Test that a closed engine rejects writes and reads."""
+        memory = self.engine.add("Stored")
+        self.engine.close()
+
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.engine.add("Too late")
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.engine.recall("Stored")
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.engine.get(memory.id)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.engine.count()
+        self.assertEqual(self.engine._connections, {})
+
+    def test_access_flushed_at_exit(self):
+        """Test that an unclosed engine writes buffered accesses at exit."""
+        db_path = os.path.join(self.temp_dir, "exit_flush.db")
+        script = (
+            "import sys; sys.path.insert(0, '..')\n"
+            "from connection_core import MemoryEngine, MemoryConfig\n"
+            f"engine = MemoryEngine(MemoryConfig(storage_path={db_path!r}))\n"
+            "engine.add('Recalled before exit')\n"
+            "engine.recall('recalled')\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+        engine = MemoryEngine(MemoryConfig(storage_path=db_path))
+        try:
+            self.assertEqual(engine.recall("recalled")[0].access_count, 1)
+        finally:
+            engine.close()
+
+    def test_collected_without_close(self):
+        """Test that an unclosed engine is collected and its writer stops."""
+        engine = MemoryEngine(MemoryConfig(
+            storage_path=os.path.join(self.temp_dir, "unclosed.db")
+        ))
+        engine.add("Left open")
+        writer = engine._writer
+        ref = weakref.ref(engine)
+
+        del engine
+        gc.collect()
+
+        self.assertIsNone(ref())
+        writer.join(timeout=5)
+        self.assertFalse(writer.is_alive())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,7 +9,9 @@ Benchmarks for the memory engine.
 import os
 import sys
 import time
+import timeit
 import tempfile
+import itertools
 import statistics
 
 sys.path.insert(0, '..')
@@ -17,80 +19,123 @@ sys.path.insert(0, '..')
 from connection_core import MemoryEngine, MemoryConfig
 
 
-def benchmark_add(engine: MemoryEngine, count: int = 1000) -> dict:
-    """Benchmark memory addition."""
-    times = []
+REPEATS = 5
+
+
+def _time_per_op(stmt, number: int, ops_per_call: int = 1) -> list:
+    """
+    Time `stmt` in REPEATS batches of `number` calls.
 
-    for i in range(count):
-        start = time.perf_counter()
-        engine.add(f"Benchmark memory content {i} with some additional text")
-        elapsed = (time.perf_counter() - start) * 1000
-        times.append(elapsed)
+    One perf_counter_ns pair brackets each batch, so clock overhead is
+    amortised over the batch instead of dominating every operation.
 
+    Returns:
+        Mean per-operation latency of each batch, in ms
+    """
+    timer = timeit.Timer(stmt=stmt, timer=time.perf_counter_ns)
+    totals_ns = timer.repeat(repeat=REPEATS, number=number)
+    return [total / (number * ops_per_call) / 1e6 for total in totals_ns]
+
+
+def _summarize(operation: str, count: int, times: list) -> dict:
+    """
+    Summary statistics over per-batch latencies.
+
+    Each entry of `times` is one batch's mean per-operation latency, so the
+    spread fields describe batch means, not single operations: the slowest
+    individual operation can be far above batch_max_ms.
+    """
     return {
-        "operation": "add",
+        "operation": operation,
         "count": count,
         "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "std_ms": statistics.stdev(times) if len(times) > 1 else 0,
-        "min_ms": min(times),
-        "max_ms": max(times),
-        "total_ms": sum(times),
+        "batch_median_ms": statistics.median(times),
+        "batch_std_ms": statistics.stdev(times) if len(times) > 1 else 0,
+        "batch_min_ms": min(times),
+        "batch_max_ms": max(times),
     }
 
 
-def benchmark_recall(engine: MemoryEngine, queries: list, runs: int = 100) -> dict:
+def benchmark_add(engine: MemoryEngine, count: int = 1000) -> dict:
+    """Benchmark memory addition."""
+    number = max(1, count // REPEATS)
+    counter = itertools.count()
+
+    times = _time_per_op(
+        lambda: engine.add(
+            f"Benchmark memory content {next(counter)} with some additional text"
+        ),
+        number,
+    )
+
+    result = _summarize("add", number * REPEATS, times)
+    result["total_ms"] = sum(times) * number
+    return result
+
+
+def benchmark_add_many(engine: MemoryEngine, count: int = 1000, batch_size: int = 100) -> dict:
+    """Benchmark batched addition (one transaction per add_many call)."""
+    number = max(1, count // (REPEATS * batch_size))
+    counter = itertools.count()
+
+    def add_batch():
+        engine.add_many([
+            {"content": f"Batched memory content {next(counter)} with some additional text"}
+            for _ in range(batch_size)
+        ])
+
+    times = _time_per_op(add_batch, number, batch_size)
+    result = _summarize("add_many", number * REPEATS * batch_size, times)
+    result["total_ms"] = sum(times) * number * batch_size
+    return result
+
+
+def benchmark_recall(
+    engine: MemoryEngine,
+    queries: list,
+    runs: int = 100,
+    operation: str = "recall"
+) -> dict:
     """Benchmark memory recall."""
-    times = []
+    number = max(1, runs // REPEATS)
 
-    for _ in range(runs):
+    def recall_all():
         for query in queries:
-            start = time.perf_counter()
             engine.recall(query, limit=5)
-            elapsed = (time.perf_counter() - start) * 1000
-            times.append(elapsed)
 
-    return {
-        "operation": "recall",
-        "count": len(times),
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "std_ms": statistics.stdev(times) if len(times) > 1 else 0,
-        "min_ms": min(times),
-        "max_ms": max(times),
-    }
+    times = _time_per_op(recall_all, number, len(queries))
+    return _summarize(operation, number * REPEATS * len(queries), times)
 
 
 def benchmark_get(engine: MemoryEngine, memory_ids: list, runs: int = 100) -> dict:
     """Benchmark memory get by ID."""
-    times = []
+    number = max(1, runs // REPEATS)
 
-    for _ in range(runs):
-        for mid in memory_ids:
-            start = time.perf_counter()
-            engine.get(mid)
-            elapsed = (time.perf_counter() - start) * 1000
-            times.append(elapsed)
+    def get_all():
+        for memory_id in memory_ids:
+            engine.get(memory_id)
 
-    return {
-        "operation": "get",
-        "count": len(times),
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "std_ms": statistics.stdev(times) if len(times) > 1 else 0,
-        "min_ms": min(times),
-        "max_ms": max(times),
-    }
+    times = _time_per_op(get_all, number, len(memory_ids))
+    return _summarize("get", number * REPEATS * len(memory_ids), times)
+
+
+def benchmark_get_many(engine: MemoryEngine, memory_ids: list, runs: int = 100) -> dict:
+    """Benchmark batched get by ID (one get_many per run), per memory."""
+    number = max(1, runs // REPEATS)
+
+    times = _time_per_op(lambda: engine.get_many(memory_ids), number, len(memory_ids))
+    return _summarize("get_many", number * REPEATS * len(memory_ids), times)
 
 
 def print_result(result: dict):
     """Print benchmark result."""
     print(f"\n{result['operation'].upper()} ({result['count']} operations)")
     print(f"  Mean:   {result['mean_ms']:.3f}ms")
-    print(f"  Median: {result['median_ms']:.3f}ms")
-    print(f"  Std:    {result['std_ms']:.3f}ms")
-    print(f"  Min:    {result['min_ms']:.3f}ms")
-    print(f"  Max:    {result['max_ms']:.3f}ms")
+    print(f"  Over {REPEATS} batch means:")
+    print(f"    Median: {result['batch_median_ms']:.3f}ms")
+    print(f"    Std:    {result['batch_std_ms']:.3f}ms")
+    print(f"    Min:    {result['batch_min_ms']:.3f}ms")
+    print(f"    Max:    {result['batch_max_ms']:.3f}ms")
 
 
 def main():
@@ -106,9 +151,14 @@ def main():
     temp_dir = tempfile.mkdtemp()
     db_path = os.path.join(temp_dir, "benchmark.db")
 
+    # Benchmark the production storage setup: WAL + memory-mapped reads.
+    # The recall cache starts off so repeated queries still reach SQLite
     config = MemoryConfig(
         storage_path=db_path,
         max_memories=50000,
+        wal_mode=True,
+        mmap_size_bytes=256 << 20,
+        recall_cache_size=0,
     )
     engine = MemoryEngine(config)
 
@@ -118,6 +168,11 @@ def main():
         add_result = benchmark_add(engine, count=1000)
         print_result(add_result)
 
+        # Benchmark ADD_MANY
+        print("\n>>> Benchmarking ADD_MANY operation...")
+        add_many_result = benchmark_add_many(engine, count=1000)
+        print_result(add_many_result)
+
         # Get some memory IDs for GET benchmark
         memories = engine.recall("Benchmark", limit=10)
         memory_ids = [m.id for m in memories]
@@ -128,11 +183,24 @@ def main():
         recall_result = benchmark_recall(engine, queries, runs=20)
         print_result(recall_result)
 
+        # Benchmark RECALL served from the recall cache
+        print("\n>>> Benchmarking cached RECALL operation...")
+        engine.config.recall_cache_size = MemoryConfig().recall_cache_size
+        cached_recall_result = benchmark_recall(
+            engine, queries, runs=20, operation="recall (cached)"
+        )
+        print_result(cached_recall_result)
+
         # Benchmark GET
         print("\n>>> Benchmarking GET operation...")
         get_result = benchmark_get(engine, memory_ids, runs=50)
         print_result(get_result)
 
+        # Benchmark GET_MANY
+        print("\n>>> Benchmarking GET_MANY operation...")
+        get_many_result = benchmark_get_many(engine, memory_ids, runs=50)
+        print_result(get_many_result)
+
         # Check database size
         db_size = os.path.getsize(db_path)
         db_size_kb = db_size / 1024
@@ -147,8 +215,10 @@ def main():
 
     Performance:
     - Add:    {add_result['mean_ms']:.3f}ms mean
-    - Recall: {recall_result['mean_ms']:.3f}ms mean
+    - Batch:  {add_many_result['mean_ms']:.3f}ms mean per memory
+    - Recall: {recall_result['mean_ms']:.3f}ms mean ({cached_recall_result['mean_ms']:.3f}ms cached)
     - Get:    {get_result['mean_ms']:.3f}ms mean
+    - GetMany: {get_many_result['mean_ms']:.3f}ms mean per memory
 
     Targets:
     - Recall <50ms:    {'PASS' if recall_result['mean_ms'] < 50 else 'FAIL'}
@@ -0,0 +1,11 @@
+"""
+Compatibility Helpers
+=====================
+
+Version shims shared by the Quantum Lock modules.
+"""
+
+import sys
+
+# slots drop the per-instance __dict__ (dataclass(slots=...) needs 3.10+)
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
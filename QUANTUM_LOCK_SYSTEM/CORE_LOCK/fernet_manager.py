@@ -7,13 +7,22 @@ Manages Fernet encryption/decryption operations for Quantum Lock.
 
 import os
 import base64
-from typing import Optional, Tuple
+import struct
+import tempfile
+from functools import lru_cache
+from typing import BinaryIO, Iterator, Optional, Tuple
 from pathlib import Path
 
 from cryptography.fernet import Fernet, MultiFernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+# Optional: memory-hard Argon2id key derivation
+try:
+    from argon2.low_level import hash_secret_raw, Type as Argon2Type
+except ImportError:
+    hash_secret_raw = None
+
 
 class FernetManager:
     """
@@ -26,6 +35,21 @@ class FernetManager:
     - Secure key generation
     """
 
+    PBKDF2_ITERATIONS = 480000  # OWASP recommended
+    ARGON2_TIME_COST = 3
+    ARGON2_MEMORY_COST = 64 * 1024  # KiB
+    ARGON2_PARALLELISM = 4
+
+    # Streamed files: magic, a random 16-byte stream ID, then frames of
+    # <u32 token length><Fernet token>. Each token's plaintext starts with
+    # <stream ID><u64 frame index><bool last> so reordered, dropped,
+    # truncated or spliced-in frames are rejected.
+    STREAM_MAGIC = b"FRN1"
+    STREAM_ID_SIZE = 16
+    STREAM_CHUNK_SIZE = 1 << 20
+    _FRAME_LENGTH = struct.Struct(">I")
+    _FRAME_HEADER = struct.Struct(">16sQ?")
+
     def __init__(self):
         self._fernet: Optional[Fernet] = None
         self._multi_fernet: Optional[MultiFernet] = None
@@ -58,14 +82,22 @@ class FernetManager:
     def derive_key_from_password(
         self,
         password: str,
-        salt: Optional[bytes] = None
+        salt: Optional[bytes] = None,
+        kdf: str = "pbkdf2",
+        iterations: Optional[int] = None
     ) -> Tuple[bytes, bytes]:
         """
         Derive a Fernet key from a password.
 
+        PBKDF2 runs in OpenSSL, which uses the CPU's SHA extensions where
+        present. "argon2id" is memory-hard and needs argon2-cffi. A key must
+        be re-derived with the same kdf (and iterations) it was created with.
+
         Args:
             password: Password to derive from
             salt: Optional salt (generated if not provided)
+            kdf: "pbkdf2" or "argon2id"
+            iterations: PBKDF2 iterations (default PBKDF2_ITERATIONS)
 
         Returns:
             Tuple of (key, salt)
@@ -73,14 +105,29 @@ class FernetManager:
         if salt is None:
             salt = os.urandom(16)
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=480000,  # OWASP recommended
-        )
-
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        if kdf == "pbkdf2":
+            raw = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=salt,
+                iterations=iterations or self.PBKDF2_ITERATIONS,
+            ).derive(password.encode())
+        elif kdf == "argon2id":
+            if hash_secret_raw is None:
+                raise ImportError("argon2id key derivation requires argon2-cffi")
+            raw = hash_secret_raw(
+                password.encode(),
+                salt,
+                time_cost=self.ARGON2_TIME_COST,
+                memory_cost=self.ARGON2_MEMORY_COST,
+                parallelism=self.ARGON2_PARALLELISM,
+                hash_len=32,
+                type=Argon2Type.ID,
+            )
+        else:
+            raise ValueError(f"Unknown kdf: {kdf}")
+
+        key = base64.urlsafe_b64encode(raw)
         self.load_key(key)
 
         return key, salt
@@ -109,9 +156,118 @@ class FernetManager:
         with open(output_path, "wb") as f:
             f.write(encrypted)
 
+    def encrypt_stream(
+        self,
+        input_path: str,
+        output_path: str,
+        chunk_size: Optional[int] = None
+    ) -> None:
+        """
+        Encrypt a file frame by frame, holding one chunk in memory at a time.
+
+        The output is read back by decrypt_stream, decrypt_file and
+        decrypt_to_memory.
+
+        Args:
+            input_path: Plaintext file
+            output_path: Encrypted output
+            chunk_size: Plaintext bytes per frame (default STREAM_CHUNK_SIZE)
+        """
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+
+        stream_id = os.urandom(self.STREAM_ID_SIZE)
+
+        with open(input_path, "rb") as fin, open(output_path, "wb") as fout:
+            fout.write(self.STREAM_MAGIC)
+            fout.write(stream_id)
+
+            index = 0
+            chunk = fin.read(chunk_size)
+            while True:
+                # Read one chunk ahead so the final frame can be marked
+                next_chunk = fin.read(chunk_size)
+                last = not next_chunk
+                token = self.encrypt(self._FRAME_HEADER.pack(stream_id, index, last) + chunk)
+                fout.write(self._FRAME_LENGTH.pack(len(token)))
+                fout.write(token)
+                if last:
+                    break
+                chunk = next_chunk
+                index += 1
+
+    def _iter_stream(self, fin: BinaryIO) -> Iterator[bytes]:
+        """Yield decrypted chunks from a stream positioned after the magic."""
+        header_size = self._FRAME_HEADER.size
+        stream_id = fin.read(self.STREAM_ID_SIZE)
+        if len(stream_id) < self.STREAM_ID_SIZE:
+            raise ValueError("Truncated encrypted stream")
+        expected = 0
+
+        while True:
+            length_bytes = fin.read(self._FRAME_LENGTH.size)
+            if len(length_bytes) < self._FRAME_LENGTH.size:
+                raise ValueError("Truncated encrypted stream")
+            (length,) = self._FRAME_LENGTH.unpack(length_bytes)
+
+            token = fin.read(length)
+            if len(token) < length:
+                raise ValueError("Truncated encrypted stream")
+
+            payload = self.decrypt(token)
+            if len(payload) < header_size:
+                raise ValueError("Malformed encrypted stream frame")
+            frame_id, index, last = self._FRAME_HEADER.unpack_from(payload)
+            if frame_id != stream_id:
+                raise ValueError("Encrypted stream frame from another stream")
+            if index != expected:
+                raise ValueError("Encrypted stream frames out of order")
+            yield payload[header_size:]
+
+            if last:
+                if fin.read(1):
+                    raise ValueError("Trailing data after encrypted stream")
+                return
+            expected += 1
+
+    def _is_stream(self, f: BinaryIO) -> bool:
+        """Consume the stream magic if present; rewind otherwise."""
+        if f.read(len(self.STREAM_MAGIC)) == self.STREAM_MAGIC:
+            return True
+        f.seek(0)
+        return False
+
+    def _write_stream(self, fin: BinaryIO, output_path: str) -> None:
+        """
+        Decrypt stream frames from fin into output_path.
+
+        Frames go to a temp file beside output_path that is renamed into
+        place once the whole stream has verified, so a bad frame never
+        leaves partial plaintext at output_path.
+        """
+        out_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".decrypt-")
+        try:
+            with os.fdopen(fd, "wb") as fout:
+                for chunk in self._iter_stream(fin):
+                    fout.write(chunk)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def decrypt_stream(self, input_path: str, output_path: str) -> None:
+        """Decrypt a file written by encrypt_stream, one frame at a time."""
+        with open(input_path, "rb") as fin:
+            if not self._is_stream(fin):
+                raise ValueError("Not an encrypted stream")
+            self._write_stream(fin, output_path)
+
     def decrypt_file(self, input_path: str, output_path: str) -> None:
-        """Decrypt a file."""
+        """Decrypt a file (single-token or streamed)."""
         with open(input_path, "rb") as f:
+            if self._is_stream(f):
+                self._write_stream(f, output_path)
+                return
             encrypted = f.read()
 
         decrypted = self.decrypt(encrypted)
@@ -122,10 +278,52 @@ class FernetManager:
     def decrypt_to_memory(self, input_path: str) -> bytes:
         """Decrypt file to memory only (never written to disk)."""
         with open(input_path, "rb") as f:
+            if self._is_stream(f):
+                return b"".join(self._iter_stream(f))
             encrypted = f.read()
 
         return self.decrypt(encrypted)
 
+    def decrypt_to_memfd(self, input_path: str) -> int:
+        """
+        Decrypt a file into anonymous, memory-backed storage.
+
+        Uses memfd_create on Linux, otherwise an anonymous temp file in
+        /dev/shm (or the temp dir) that is removed once closed. Streamed
+        files are decrypted frame by frame, so the plaintext never sits on
+        the Python heap whole and loaders can mmap it directly:
+
+            fd = manager.decrypt_to_memfd("model.enc")
+            weights = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+
+        Returns:
+            File descriptor positioned at 0; the caller closes it
+        """
+        fd = -1
+        try:
+            if hasattr(os, "memfd_create"):
+                fd = os.memfd_create("quantum-lock-model", os.MFD_CLOEXEC)
+            else:
+                # Unlinked on creation on POSIX, opened O_TEMPORARY on Windows
+                shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+                with tempfile.TemporaryFile(dir=shm_dir) as tmp:
+                    fd = os.dup(tmp.fileno())
+
+            with open(input_path, "rb") as fin, \
+                    os.fdopen(fd, "wb", closefd=False) as out:
+                if self._is_stream(fin):
+                    for chunk in self._iter_stream(fin):
+                        out.write(chunk)
+                else:
+                    out.write(self.decrypt(fin.read()))
+            os.lseek(fd, 0, os.SEEK_SET)
+        except BaseException:
+            if fd >= 0:
+                os.close(fd)
+            raise
+
+        return fd
+
     # Key rotation support
     def setup_key_rotation(self, new_key: bytes, old_keys: list) -> None:
         """
@@ -155,6 +353,17 @@ class FernetManager:
 
 
 # Convenience functions
+@lru_cache(maxsize=8)
+def _manager_for(key: bytes) -> FernetManager:
+    """
+    Shared manager per key, so repeated calls skip key parsing and cipher
+    setup. Call _manager_for.cache_clear() to drop the cached keys.
+    """
+    manager = FernetManager()
+    manager.load_key(key)
+    return manager
+
+
 def encrypt_model(model_path: str, output_path: str, key: Optional[bytes] = None) -> bytes:
     """
     Encrypt a model file.
@@ -167,12 +376,11 @@ def encrypt_model(model_path: str, output_path: str, key: Optional[bytes] = None
     Returns:
         The encryption key
     """
-    manager = FernetManager()
-
     if key is None:
+        manager = FernetManager()
         key = manager.generate_key()
     else:
-        manager.load_key(key)
+        manager = _manager_for(key)
 
     manager.encrypt_file(model_path, output_path)
 
@@ -190,6 +398,4 @@ def decrypt_model_to_memory(encrypted_path: str, key: bytes) -> bytes:
     Returns:
         Decrypted model data
     """
-    manager = FernetManager()
-    manager.load_key(key)
-    return manager.decrypt_to_memory(encrypted_path)
+    return _manager_for(key).decrypt_to_memory(encrypted_path)
@@ -6,12 +6,101 @@ Verifies integrity of model files and distributions.
 """
 
 import os
+import re
 import json
+import mmap
+import stat
+import fnmatch
 import hashlib
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
+# Optional: BLAKE3 for fast internal manifests
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+def _new_hasher(algorithm: str):
+    """Hash object for `algorithm` ("blake3" or any hashlib name)."""
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ImportError("blake3 hashing requires the blake3 package")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algorithm)
+
+
+def _digest_stream(f, algorithm: str):
+    """Hash a file object to EOF, in C via hashlib.file_digest where available."""
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(f, lambda: _new_hasher(algorithm))
+
+    hasher = _new_hasher(algorithm)
+    for chunk in iter(lambda: f.read(256 * 1024), b""):
+        hasher.update(chunk)
+    return hasher
+
+
+def _hash_file(path: str, window: int, algorithm: str = "sha256") -> str:
+    """Hash of a file, read through mmap windows of `window` bytes."""
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # Pipes and devices can't be mapped, and procfs-style files
+            # report size 0 while still having content: read to EOF
+            # instead (this also covers genuinely empty files)
+            return _digest_stream(f, algorithm).hexdigest()
+
+        hasher = _new_hasher(algorithm)
+        size = st.st_size
+        # Hash mapped windows straight from the page cache: one update
+        # per window instead of one read and copy per 64 KiB chunk
+        for offset in range(0, size, window):
+            length = min(window, size - offset)
+            with mmap.mmap(
+                f.fileno(), length, offset=offset, access=mmap.ACCESS_READ
+            ) as mapped:
+                hasher.update(mapped)
+
+    return hasher.hexdigest()
+
+
+def _try_hash(
+    path: str,
+    window: int,
+    algorithm: str = "sha256"
+) -> Tuple[Optional[str], Optional[str]]:
+    """Pool worker: (hash, None) on success, (None, error) on failure."""
+    try:
+        return _hash_file(path, window, algorithm), None
+    except FileNotFoundError:
+        return None, "File not found"
+    except Exception as e:
+        return None, str(e)
+
+
+def _walk_files(root: str) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (size, path) for every file under root.
+
+    os.scandir entries cache their type and stat, so each file is stat'd
+    once. Hidden entries are skipped, as with glob's "**/*".
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.stat().st_size, entry.path
+
 
 @dataclass
 class IntegrityResult:
@@ -33,22 +122,44 @@ class IntegrityVerifier:
     - Directory verification
     """
 
-    ALGORITHM = "sha256"
+    ALGORITHM = "sha256"  # default; distribution manifests stay SHA-256
     MANIFEST_FILE = "integrity.json"
+    HASH_WINDOW = 256 << 20  # mmap window; bounds address space on huge files
+    STAT_CACHE_SUFFIX = ".stat.json"  # integrity.json -> integrity.stat.json
+    PARALLEL_MIN_BYTES = 64 << 20  # below this total, pool startup costs more than it saves
 
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(
+        self,
+        base_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        stat_cache: bool = False,
+        algorithm: Optional[str] = None
+    ):
         """
         Initialize verifier.
 
         Args:
             base_path: Base path for relative file paths
+            max_workers: Processes used to hash large file sets (default: CPU count)
+            stat_cache: Reuse the last hash of files whose inode, size and
+                mtime are unchanged instead of re-reading them. Faster, but
+                trusts file metadata, so leave off where tampering matters.
+            algorithm: "sha256" (default) or "blake3" (needs the blake3
+                package; much faster on large files). Loading a manifest
+                switches to the algorithm recorded in it.
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.stat_cache = stat_cache
+        self.algorithm = algorithm or self.ALGORITHM
+        _new_hasher(self.algorithm)  # fail fast on unknown/unavailable
         self._manifest: Dict[str, str] = {}
+        # path -> [st_ino, st_size, st_mtime_ns, hash, algorithm]
+        self._stat_cache: Dict[str, List] = {}
 
     def calculate_hash(self, file_path: str) -> str:
         """
-        Calculate SHA-256 hash of a file.
+        Calculate the hash of a file with the verifier's algorithm.
 
         Args:
             file_path: Path to file
@@ -56,14 +167,115 @@ class IntegrityVerifier:
         Returns:
             Hex-encoded hash string
         """
-        path = self._resolve_path(file_path)
+        return _hash_file(
+            str(self._resolve_path(file_path)), self.HASH_WINDOW, self.algorithm
+        )
 
-        sha256 = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                sha256.update(chunk)
+    def _hash_many(self, paths: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Hash independent files, preserving order.
 
-        return sha256.hexdigest()
+        Files are hashed in a process pool only when there are at least two
+        and together they reach PARALLEL_MIN_BYTES; smaller sets are hashed
+        serially in this process. On spawn platforms (Windows, macOS) a
+        script that verifies that much data needs an
+        `if __name__ == "__main__":` guard.
+
+        Returns:
+            One (hash, error) pair per path
+        """
+        worker = partial(_try_hash, window=self.HASH_WINDOW, algorithm=self.algorithm)
+        if (len(paths) < 2 or self.max_workers < 2
+                or self._total_size(paths) < self.PARALLEL_MIN_BYTES):
+            return [worker(path) for path in paths]
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(paths))) as ex:
+            return list(ex.map(worker, paths, chunksize=4))
+
+    @staticmethod
+    def _total_size(paths: List[str]) -> int:
+        """Combined size of the files that can be stat'd."""
+        total = 0
+        for path in paths:
+            try:
+                total += os.stat(path).st_size
+            except OSError:
+                pass
+        return total
+
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple[int, int, int]]:
+        """(inode, size, mtime_ns) of a file, or None if it can't be stat'd."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _stat_cache_hit(self, path: str, key: Optional[Tuple[int, int, int]]) -> Optional[str]:
+        """Cached hash of `path` if its stat key is unchanged."""
+        entry = self._stat_cache.get(path)
+        if (key is not None and entry is not None and tuple(entry[:3]) == key
+                and entry[4:] == [self.algorithm]):
+            return entry[3]
+        return None
+
+    def _stat_cached_hash(self, path: str) -> str:
+        """calculate_hash, served from the stat cache when enabled."""
+        if not self.stat_cache:
+            return self.calculate_hash(path)
+
+        key = self._stat_key(path)
+        hash_value = self._stat_cache_hit(path, key)
+        if hash_value is None:
+            hash_value = self.calculate_hash(path)
+            if key is not None:
+                self._stat_cache[path] = [*key, hash_value, self.algorithm]
+        return hash_value
+
+    def _cached_hashes(self, paths: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Like _hash_many, but serves files with unchanged stat from the
+        stat cache when it is enabled, and records fresh hashes in it.
+        """
+        if not self.stat_cache:
+            return self._hash_many(paths)
+
+        keys = [self._stat_key(path) for path in paths]
+        results: List[Tuple[Optional[str], Optional[str]]] = [(None, None)] * len(paths)
+        stale = []
+        for i, (path, key) in enumerate(zip(paths, keys)):
+            hash_value = self._stat_cache_hit(path, key)
+            if hash_value is not None:
+                results[i] = (hash_value, None)
+            else:
+                stale.append(i)
+
+        hashed = self._hash_many([paths[i] for i in stale])
+        for i, (hash_value, error) in zip(stale, hashed):
+            results[i] = (hash_value, error)
+            if error is None and keys[i] is not None:
+                self._stat_cache[paths[i]] = [*keys[i], hash_value, self.algorithm]
+
+        return results
+
+    def _stat_cache_path(self, manifest_path: str) -> Path:
+        """Sidecar stat cache stored next to a manifest."""
+        path = Path(manifest_path)
+        return path.with_name(path.stem + self.STAT_CACHE_SUFFIX)
+
+    def _load_stat_cache(self, manifest_path: str) -> None:
+        """Merge a saved stat cache; a missing or corrupt one is ignored."""
+        try:
+            with open(self._stat_cache_path(manifest_path), "r") as f:
+                self._stat_cache.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def _save_stat_cache(self, manifest_path: str) -> None:
+        """Write the stat cache next to the manifest."""
+        with open(self._stat_cache_path(manifest_path), "w") as f:
+            json.dump(self._stat_cache, f)
 
     def _resolve_path(self, file_path: str) -> Path:
         """Resolve file path relative to base path."""
@@ -78,7 +290,7 @@ class IntegrityVerifier:
 
         Args:
             file_path: Path to file
-            expected_hash: Expected SHA-256 hash
+            expected_hash: Expected hash (in the verifier's algorithm)
 
         Returns:
             IntegrityResult with verification status
@@ -95,7 +307,7 @@ class IntegrityVerifier:
                     error="File not found"
                 )
 
-            actual_hash = self.calculate_hash(str(path))
+            actual_hash = self._stat_cached_hash(str(path))
 
             return IntegrityResult(
                 is_valid=(actual_hash == expected_hash),
@@ -124,13 +336,13 @@ class IntegrityVerifier:
             Dictionary mapping file paths to hashes
         """
         manifest = {}
+        paths = [str(self._resolve_path(file_path)) for file_path in file_paths]
 
-        for file_path in file_paths:
-            try:
-                hash_value = self.calculate_hash(file_path)
+        for file_path, (hash_value, error) in zip(file_paths, self._hash_many(paths)):
+            if error is None:
                 manifest[file_path] = hash_value
-            except Exception as e:
-                print(f"Warning: Could not hash {file_path}: {e}")
+            else:
+                print(f"Warning: Could not hash {file_path}: {error}")
 
         self._manifest = manifest
         return manifest
@@ -147,7 +359,7 @@ class IntegrityVerifier:
 
         with open(output_path, "w") as f:
             json.dump({
-                "algorithm": self.ALGORITHM,
+                "algorithm": self.algorithm,
                 "files": self._manifest
             }, f, indent=2)
 
@@ -167,6 +379,7 @@ class IntegrityVerifier:
         with open(manifest_path, "r") as f:
             data = json.load(f)
 
+        self.algorithm = data.get("algorithm", self.ALGORITHM)
         self._manifest = data.get("files", {})
         return self._manifest
 
@@ -183,12 +396,38 @@ class IntegrityVerifier:
         Returns:
             Tuple of (all_valid, list of results)
         """
+        if manifest_path is None:
+            manifest_path = str(self.base_path / self.MANIFEST_FILE)
+
         manifest = self.load_manifest(manifest_path)
+        paths = [str(self._resolve_path(file_path)) for file_path in manifest]
+
+        if self.stat_cache:
+            self._load_stat_cache(manifest_path)
+        all_valid, results = self._verify_paths(paths, list(manifest.values()))
+        if self.stat_cache:
+            self._save_stat_cache(manifest_path)
+
+        return all_valid, results
+
+    def _verify_paths(
+        self,
+        paths: List[str],
+        expected_hashes: List[str]
+    ) -> Tuple[bool, List[IntegrityResult]]:
+        """Hash paths (in parallel) and compare against expected hashes."""
         results = []
         all_valid = True
 
-        for file_path, expected_hash in manifest.items():
-            result = self.verify_file(file_path, expected_hash)
+        hashes = self._cached_hashes(paths)
+        for path, expected_hash, (actual_hash, error) in zip(paths, expected_hashes, hashes):
+            result = IntegrityResult(
+                is_valid=(error is None and actual_hash == expected_hash),
+                file_path=path,
+                expected_hash=expected_hash,
+                actual_hash=actual_hash,
+                error=error
+            )
             results.append(result)
             if not result.is_valid:
                 all_valid = False
@@ -201,40 +440,44 @@ class IntegrityVerifier:
         patterns: Optional[List[str]] = None
     ) -> Tuple[bool, List[IntegrityResult]]:
         """
-        Verify all files in a directory.
+        Verify all files in a directory that appear in the loaded manifest.
 
         Args:
             directory: Directory to verify
-            patterns: Optional glob patterns to match
+            patterns: Optional fnmatch patterns, matched against paths
+                relative to the directory ("*" may cross directories;
+                "**/" also matches zero directories)
 
         Returns:
             Tuple of (all_valid, list of results)
         """
-        import glob
-
-        dir_path = self._resolve_path(directory)
-
-        if patterns is None:
-            patterns = ["**/*"]
-
-        files = []
-        for pattern in patterns:
-            files.extend(glob.glob(str(dir_path / pattern), recursive=True))
-
-        # Filter to actual files
-        files = [f for f in files if os.path.isfile(f)]
-
-        results = []
-        all_valid = True
-
-        for file_path in files:
-            if file_path in self._manifest:
-                result = self.verify_file(file_path, self._manifest[file_path])
-                results.append(result)
-                if not result.is_valid:
-                    all_valid = False
-
-        return all_valid, results
+        dir_path = str(self._resolve_path(directory))
+
+        # All patterns compiled once into a single regex
+        matcher = None
+        if patterns:
+            expanded = []
+            for pattern in patterns:
+                expanded.append(pattern)
+                if pattern.startswith("**/"):
+                    expanded.append(pattern[3:])
+            matcher = re.compile("|".join(fnmatch.translate(p) for p in expanded))
+
+        # One walk; files are checked against the manifest (by full or
+        # base-relative path) before anything is hashed
+        paths = []
+        expected_hashes = []
+        for _, path in _walk_files(dir_path):
+            if matcher is not None and not matcher.match(os.path.relpath(path, dir_path)):
+                continue
+            expected = self._manifest.get(path)
+            if expected is None:
+                expected = self._manifest.get(os.path.relpath(path, self.base_path))
+            if expected is not None:
+                paths.append(path)
+                expected_hashes.append(expected)
+
+        return self._verify_paths(paths, expected_hashes)
 
 
 def create_distribution_manifest(
@@ -253,10 +496,9 @@ def create_distribution_manifest(
     """
     verifier = IntegrityVerifier(dist_path)
 
-    # Find all files
-    import glob
-    files = glob.glob(f"{dist_path}/**/*", recursive=True)
-    files = [f for f in files if os.path.isfile(f)]
+    # Find all files, largest first so the biggest hashes start earliest
+    # in the process pool and don't straggle at the end
+    files = [path for _, path in sorted(_walk_files(dist_path), reverse=True)]
 
     # Create manifest
     manifest = verifier.create_manifest(files)
@@ -14,22 +14,31 @@ from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from ._compat import SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **SLOTS)
 class LicenseInfo:
-    """License information."""
+    """License information (immutable: validated infos are shared via a cache)."""
     is_valid: bool = False
     license_type: str = "unknown"  # trial, standard, enterprise
     model: str = "unknown"
     expires: Optional[datetime] = None
-    features: list = None
+    features: Tuple[str, ...] = ()
     max_requests: int = 0
     hardware_locked: bool = False
     error: Optional[str] = None
 
     def __post_init__(self):
-        if self.features is None:
-            self.features = []
+        if not isinstance(self.features, tuple):
+            object.__setattr__(self, "features", tuple(self.features or ()))
+
+
+# Validated keys -> (LicenseInfo, monotonic deadline). Keys are checked on
+# the request path, often the same key many times a second.
+_VALIDATION_CACHE: Dict[str, Tuple[LicenseInfo, float]] = {}
+_CACHE_TTL = 300  # seconds
+_CACHE_MAX_ENTRIES = 1024
 
 
 class LicenseChecker:
@@ -50,6 +59,18 @@ class LicenseChecker:
     FEATURE_BATCH = "batch"
     FEATURE_UNLIMITED = "unlimited"
 
+    # Per-type features and request limits
+    _FEATURES = {
+        TRIAL: (FEATURE_API,),
+        STANDARD: (FEATURE_API, FEATURE_VOICE, FEATURE_BATCH),
+        ENTERPRISE: (FEATURE_API, FEATURE_VOICE, FEATURE_BATCH, FEATURE_UNLIMITED),
+    }
+    _REQUEST_LIMITS = {
+        TRIAL: 1000,
+        STANDARD: 100000,
+        ENTERPRISE: -1,  # Unlimited
+    }
+
     def __init__(self, license_path: Optional[str] = None):
         """
         Initialize license checker.
@@ -59,6 +80,9 @@ class LicenseChecker:
         """
         self.license_path = Path(license_path) if license_path else None
         self._license_info: Optional[LicenseInfo] = None
+        # Derived from _license_info for the per-request checks
+        self._expires_ts = float("inf")
+        self._max_requests = 0
         self._request_count = 0
         self._last_check = None
 
@@ -72,6 +96,11 @@ class LicenseChecker:
         Returns:
             LicenseInfo with validation results
         """
+        entry = _VALIDATION_CACHE.get(license_key)
+        if entry and time.monotonic() < entry[1]:
+            self._set_license_info(entry[0])
+            return entry[0]
+
         try:
             # Parse license key format
             # Format: MODEL-TYPE-EXPIRY-CHECKSUM
@@ -112,7 +141,13 @@ class LicenseChecker:
                 max_requests=max_requests,
             )
 
-            self._license_info = info
+            # Never let a cached entry outlive the license itself
+            ttl = min(_CACHE_TTL, (expires - datetime.now()).total_seconds())
+            if len(_VALIDATION_CACHE) >= _CACHE_MAX_ENTRIES:
+                _VALIDATION_CACHE.clear()
+            _VALIDATION_CACHE[license_key] = (info, time.monotonic() + ttl)
+
+            self._set_license_info(info)
             return info
 
         except Exception as e:
@@ -121,33 +156,19 @@ class LicenseChecker:
                 error=f"License validation error: {str(e)}"
             )
 
-    def _get_features(self, license_type: str) -> list:
-        """Get features for license type."""
-        base_features = [self.FEATURE_API]
-
-        if license_type == self.TRIAL:
-            return base_features
-
-        if license_type == self.STANDARD:
-            return base_features + [self.FEATURE_VOICE, self.FEATURE_BATCH]
+    def _set_license_info(self, info: LicenseInfo) -> None:
+        """Adopt a validated license and precompute its request limits."""
+        self._license_info = info
+        self._expires_ts = info.expires.timestamp() if info.expires else float("inf")
+        self._max_requests = info.max_requests
 
-        if license_type == self.ENTERPRISE:
-            return base_features + [
-                self.FEATURE_VOICE,
-                self.FEATURE_BATCH,
-                self.FEATURE_UNLIMITED,
-            ]
-
-        return base_features
+    def _get_features(self, license_type: str) -> Tuple[str, ...]:
+        """Get features for license type."""
+        return self._FEATURES.get(license_type, (self.FEATURE_API,))
 
     def _get_request_limit(self, license_type: str) -> int:
         """Get request limit for license type."""
-        limits = {
-            self.TRIAL: 1000,
-            self.STANDARD: 100000,
-            self.ENTERPRISE: -1,  # Unlimited
-        }
-        return limits.get(license_type, 100)
+        return self._REQUEST_LIMITS.get(license_type, 100)
 
     def check_license_file(self) -> LicenseInfo:
         """Check license from file."""
@@ -200,12 +221,11 @@ class LicenseChecker:
         if self._license_info is None or not self._license_info.is_valid:
             return False, "No valid license"
 
-        if self._license_info.expires and datetime.now() > self._license_info.expires:
+        if time.time() > self._expires_ts:
             return False, "License expired"
 
-        if self._license_info.max_requests > 0:
-            if self._request_count >= self._license_info.max_requests:
-                return False, "Request limit exceeded"
+        if self._max_requests > 0 and self._request_count >= self._max_requests:
+            return False, "Request limit exceeded"
 
         return True, "OK"
 
@@ -10,8 +10,8 @@ This module is used internally and should not be modified.
 
 import os
 import sys
-import hashlib
 import time
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 from dataclasses import dataclass
@@ -21,8 +21,32 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+from ._compat import SLOTS
+from .integrity_verifier import IntegrityVerifier, _hash_file
 
-@dataclass
+
+# Lock file format: QUANTUM_LOCK_V1:<fernet_key>
+_LOCK_PREFIX = b"QUANTUM_LOCK_V1:"
+
+
+@lru_cache(maxsize=128)
+def _derive_key(license_key: str, salt: bytes) -> bytes:
+    """
+    PBKDF2 key for (license key, salt).
+
+    Cached: PBKDF2 is slow by design, and re-verifying the same license
+    must not pay for it again.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(license_key.encode()))
+
+
+@dataclass(**SLOTS)
 class LockStatus:
     """Status of the quantum lock."""
     is_locked: bool = True
@@ -66,6 +90,8 @@ class QuantumLock:
         self._fernet: Optional[Fernet] = None
         self._is_verified = False
         self._license_data: Dict[str, Any] = {}
+        # Lock file key behind _fernet
+        self._lock_key: Optional[bytes] = None
 
         self._verify_lock_file()
 
@@ -75,20 +101,14 @@ class QuantumLock:
             raise FileNotFoundError(f"Lock file not found: {self.lock_path}")
 
         with open(self.lock_path, "rb") as f:
-            data = f.read()
+            header = f.read(len(_LOCK_PREFIX))
 
-        if not data.startswith(b"QUANTUM_LOCK_V1:"):
+        if header != _LOCK_PREFIX:
             raise ValueError("Invalid lock file format")
 
     def _derive_key(self, license_key: str, salt: bytes) -> bytes:
         """Derive encryption key from license key."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        return base64.urlsafe_b64encode(kdf.derive(license_key.encode()))
+        return _derive_key(license_key, salt)
 
     def verify_license(self, license_key: str) -> bool:
         """
@@ -100,33 +120,50 @@ class QuantumLock:
         Returns:
             True if license is valid, False otherwise
         """
+        return self._verify_with_parsed(self._try_parse_license(license_key))
+
+    def _verify_with_parsed(self, license_data: Optional[Dict[str, Any]]) -> bool:
+        """verify_license for a license already run through _try_parse_license."""
         try:
+            if license_data is None:
+                raise ValueError("Malformed license key")
+
             # Read lock file
             with open(self.lock_path, "rb") as f:
                 lock_data = f.read()
 
             # Extract encryption key from lock
-            # Format: QUANTUM_LOCK_V1:<fernet_key>
-            if not lock_data.startswith(b"QUANTUM_LOCK_V1:"):
+            if not lock_data.startswith(_LOCK_PREFIX):
                 return False
 
-            stored_key = lock_data[len(b"QUANTUM_LOCK_V1:"):]
+            # Reuse the Fernet instance while the lock file holds the same key
+            key = lock_data[len(_LOCK_PREFIX):]
+            if self._fernet is None or key != self._lock_key:
+                self._fernet = Fernet(key)
+                self._lock_key = key
 
-            # Create Fernet instance
-            self._fernet = Fernet(stored_key)
             self._is_verified = True
 
-            # Parse license data
-            self._license_data = self._parse_license(license_key)
+            self._license_data = license_data
 
             return True
 
         except Exception as e:
             self._is_verified = False
             self._fernet = None
+            self._lock_key = None
             return False
 
-    def _parse_license(self, license_key: str) -> Dict[str, Any]:
+    @classmethod
+    def _try_parse_license(cls, license_key: str) -> Optional[Dict[str, Any]]:
+        """_parse_license, or None if the key can't be parsed."""
+        try:
+            return cls._parse_license(license_key)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _parse_license(license_key: str) -> Dict[str, Any]:
         """Parse license key into components."""
         # Simple license format: MODEL-TYPE-YEAR
         parts = license_key.split("-")
@@ -207,8 +244,7 @@ class QuantumLock:
         Returns:
             True if integrity check passes
         """
-        with open(file_path, "rb") as f:
-            actual_hash = hashlib.sha256(f.read()).hexdigest()
+        actual_hash = _hash_file(file_path, IntegrityVerifier.HASH_WINDOW)
 
         if actual_hash != expected_hash:
             self._trigger_tamper_alert()
@@ -229,10 +265,13 @@ class QuantumLock:
         """
         key = Fernet.generate_key()
 
-        lock_data = b"QUANTUM_LOCK_V1:" + key
-
-        with open(output_path, "wb") as f:
-            f.write(lock_data)
+        # One unbuffered write; new lock files are readable by the owner only
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(output_path, flags, 0o600)
+        try:
+            os.write(fd, _LOCK_PREFIX + key)
+        finally:
+            os.close(fd)
 
         return key
 
@@ -241,6 +280,7 @@ class QuantumLock:
         self._fernet = None
         self._is_verified = False
         self._license_data = {}
+        self._lock_key = None
 
 
 class QuantumLockManager:
@@ -263,8 +303,10 @@ class QuantumLockManager:
 
     def verify_all(self, license_key: str) -> Dict[str, bool]:
         """Verify license for all registered locks."""
+        # The license is the same for every lock: parse it once
+        license_data = QuantumLock._try_parse_license(license_key)
         return {
-            name: lock.verify_license(license_key)
+            name: lock._verify_with_parsed(license_data)
             for name, lock in self._locks.items()
         }
 
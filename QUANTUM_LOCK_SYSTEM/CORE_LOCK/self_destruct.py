@@ -8,15 +8,19 @@ Activates when tampering is detected.
 
 import os
 import sys
-import hashlib
+import time
 import shutil
-from typing import Optional, List, Callable
+from typing import Optional, Dict, List, Callable, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
+from ._compat import SLOTS
+from .integrity_verifier import IntegrityVerifier, _hash_file
 
-@dataclass
+
+@dataclass(**SLOTS)
 class TamperEvent:
     """Record of a tampering attempt."""
     timestamp: float
@@ -47,19 +51,37 @@ class SelfDestructSystem:
     SEVERITY_CRITICAL = "critical"
     SEVERITY_FATAL = "fatal"
 
-    def __init__(self, protected_paths: Optional[List[str]] = None):
+    # A clean debugger check is trusted for this many seconds
+    DEBUGGER_CHECK_INTERVAL = 1.0
+
+    # Random bytes written per step when overwriting a file
+    SECURE_DELETE_CHUNK = 1 << 20
+
+    def __init__(
+        self,
+        protected_paths: Optional[List[str]] = None,
+        stat_cache: bool = False
+    ):
         """
         Initialize self-destruct system.
 
         Args:
             protected_paths: Paths to monitor for tampering
+            stat_cache: Skip re-hashing files whose inode, size and mtime
+                are unchanged since they were last verified. Makes repeated
+                checks metadata-only, but trusts file metadata, which a
+                tamperer can reset.
         """
         self.protected_paths = protected_paths or []
+        self.stat_cache = stat_cache
         self._integrity_hashes: dict = {}
+        # path -> (st_ino, st_size, st_mtime_ns, hash)
+        self._fast_cache: Dict[str, Tuple[int, int, int, str]] = {}
         self._tamper_events: List[TamperEvent] = []
         self._callbacks: List[Callable[[TamperEvent], None]] = []
         self._armed = False
         self._triggered = False
+        self._last_debugger_check = float("-inf")
 
         self._logger = logging.getLogger("quantum_lock.self_destruct")
 
@@ -68,7 +90,7 @@ class SelfDestructSystem:
         # Calculate initial integrity hashes
         for path in self.protected_paths:
             if os.path.exists(path):
-                self._integrity_hashes[path] = self._calculate_hash(path)
+                self._integrity_hashes[path] = self._cached_hash(path)
 
         self._armed = True
         self._logger.info("Self-destruct system armed")
@@ -80,11 +102,22 @@ class SelfDestructSystem:
 
     def _calculate_hash(self, file_path: str) -> str:
         """Calculate SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return _hash_file(file_path, IntegrityVerifier.HASH_WINDOW)
+
+    def _cached_hash(self, file_path: str) -> str:
+        """_calculate_hash, served from the stat cache when enabled."""
+        if not self.stat_cache:
+            return self._calculate_hash(file_path)
+
+        st = os.stat(file_path)
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = self._fast_cache.get(file_path)
+        if cached and cached[:3] == key:
+            return cached[3]
+
+        hash_value = self._calculate_hash(file_path)
+        self._fast_cache[file_path] = (*key, hash_value)
+        return hash_value
 
     def check_integrity(self) -> bool:
         """
@@ -96,27 +129,64 @@ class SelfDestructSystem:
         if not self._armed:
             return True
 
-        for path, expected_hash in self._integrity_hashes.items():
-            if not os.path.exists(path):
-                self._record_tamper(
-                    "file_missing",
-                    f"Protected file missing: {path}",
-                    self.SEVERITY_CRITICAL,
-                    path
-                )
-                return False
-
-            current_hash = self._calculate_hash(path)
-            if current_hash != expected_hash:
-                self._record_tamper(
-                    "file_modified",
-                    f"Protected file modified: {path}",
-                    self.SEVERITY_CRITICAL,
-                    path
-                )
-                return False
-
-        return True
+        failure = self._find_integrity_failure(list(self._integrity_hashes.items()))
+        if failure is None:
+            return True
+
+        path, event_type = failure
+        if event_type == "file_missing":
+            details = f"Protected file missing: {path}"
+        else:
+            details = f"Protected file modified: {path}"
+        self._record_tamper(event_type, details, self.SEVERITY_CRITICAL, path)
+        return False
+
+    def _check_file(self, path: str, expected_hash: str) -> Optional[str]:
+        """Tamper event type for one protected file, or None if intact."""
+        try:
+            current_hash = self._cached_hash(path)
+        except FileNotFoundError:
+            return "file_missing"
+
+        return None if current_hash == expected_hash else "file_modified"
+
+    def _find_integrity_failure(
+        self,
+        items: List[Tuple[str, str]]
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Re-hash protected files, stopping at the first failure.
+
+        hashlib releases the GIL while hashing, so several files are
+        checked concurrently on a thread pool. Results are read in input
+        order, so the reported failure is always the first failing file.
+
+        Returns:
+            (path, event_type) of the first failing file, or None if all are intact
+        """
+        if len(items) <= 1:
+            for path, expected_hash in items:
+                event_type = self._check_file(path, expected_hash)
+                if event_type:
+                    return path, event_type
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=min(8, len(items)))
+        futures = []
+        try:
+            for path, expected_hash in items:
+                futures.append(executor.submit(self._check_file, path, expected_hash))
+            for (path, _), future in zip(items, futures):
+                event_type = future.result()
+                if event_type:
+                    return path, event_type
+            return None
+        finally:
+            # Don't wait on hashes nobody needs once a failure is found
+            # (shutdown's cancel_futures needs 3.9+)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def check_debugger(self) -> bool:
         """
@@ -125,12 +195,16 @@ class SelfDestructSystem:
         Returns:
             True if no debugger, False if debugger detected
         """
-        try:
-            # Check for common debugger indicators
-            import ctypes
+        # Called on the request path: reuse a recent clean result
+        now = time.monotonic()
+        if now - self._last_debugger_check < self.DEBUGGER_CHECK_INTERVAL:
+            return True
 
+        try:
             # Windows: IsDebuggerPresent
             if sys.platform == "win32":
+                import ctypes
+
                 if ctypes.windll.kernel32.IsDebuggerPresent():
                     self._record_tamper(
                         "debugger_detected",
@@ -141,25 +215,42 @@ class SelfDestructSystem:
 
             # Linux: Check /proc/self/status for TracerPid
             if sys.platform.startswith("linux"):
-                with open("/proc/self/status", "r") as f:
-                    for line in f:
-                        if line.startswith("TracerPid:"):
-                            tracer_pid = int(line.split(":")[1].strip())
-                            if tracer_pid != 0:
-                                self._record_tamper(
-                                    "debugger_detected",
-                                    f"Linux debugger detected (PID: {tracer_pid})",
-                                    self.SEVERITY_FATAL
-                                )
-                                return False
-                            break
+                tracer_pid = self._tracer_pid()
+                if tracer_pid:
+                    self._record_tamper(
+                        "debugger_detected",
+                        f"Linux debugger detected (PID: {tracer_pid})",
+                        self.SEVERITY_FATAL
+                    )
+                    return False
 
+            self._last_debugger_check = now
             return True
 
         except Exception:
             # If we can't check, assume it's fine
             return True
 
+    @staticmethod
+    def _tracer_pid() -> int:
+        """TracerPid from /proc/self/status (0 when not traced)."""
+        fd = os.open("/proc/self/status", os.O_RDONLY)
+        try:
+            # TracerPid sits in the first few lines; read more only if not
+            data = os.read(fd, 512)
+            start = data.find(b"TracerPid:")
+            if start < 0 or data.find(b"\n", start) < 0:
+                while chunk := os.read(fd, 4096):
+                    data += chunk
+                start = data.find(b"TracerPid:")
+                if start < 0:
+                    return 0
+        finally:
+            os.close(fd)
+
+        end = data.find(b"\n", start)
+        return int(data[start + len(b"TracerPid:"):end if end >= 0 else None])
+
     def _record_tamper(
         self,
         event_type: str,
@@ -168,8 +259,6 @@ class SelfDestructSystem:
         file_path: Optional[str] = None
     ) -> None:
         """Record a tampering event."""
-        import time
-
         event = TamperEvent(
             timestamp=time.time(),
             event_type=event_type,
@@ -179,7 +268,9 @@ class SelfDestructSystem:
         )
 
         self._tamper_events.append(event)
-        self._logger.warning(f"Tamper event: {event_type} - {details}")
+        # Re-hash everything on the next check
+        self._fast_cache.clear()
+        self._logger.warning("Tamper event: %s - %s", event_type, details)
 
         # Notify callbacks
         for callback in self._callbacks:
@@ -228,6 +319,7 @@ class SelfDestructSystem:
         """Clear sensitive data from memory."""
         # Clear integrity hashes
         self._integrity_hashes.clear()
+        self._fast_cache.clear()
 
         # Force garbage collection
         import gc
@@ -237,10 +329,15 @@ class SelfDestructSystem:
         """Securely delete protected files."""
         for path in self.protected_paths:
             if os.path.exists(path):
-                # Overwrite with random data before deletion
-                size = os.path.getsize(path)
-                with open(path, "wb") as f:
-                    f.write(os.urandom(size))
+                # Overwrite in place with random data before deletion,
+                # a chunk at a time so memory stays flat for large models
+                remaining = os.path.getsize(path)
+                with open(path, "r+b", buffering=0) as f:
+                    while remaining:
+                        n = min(self.SECURE_DELETE_CHUNK, remaining)
+                        f.write(os.urandom(n))
+                        remaining -= n
+                    os.fsync(f.fileno())
                 os.remove(path)
 
     def get_events(self) -> List[TamperEvent]:
@@ -260,9 +357,12 @@ class SelfDestructSystem:
 _system: Optional[SelfDestructSystem] = None
 
 
-def get_system(protected_paths: Optional[List[str]] = None) -> SelfDestructSystem:
+def get_system(
+    protected_paths: Optional[List[str]] = None,
+    stat_cache: bool = False
+) -> SelfDestructSystem:
     """Get or create the global self-destruct system."""
     global _system
     if _system is None:
-        _system = SelfDestructSystem(protected_paths)
+        _system = SelfDestructSystem(protected_paths, stat_cache)
     return _system
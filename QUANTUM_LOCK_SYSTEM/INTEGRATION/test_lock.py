@@ -13,7 +13,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from CORE_LOCK.quantum_lock import QuantumLock
+from CORE_LOCK.quantum_lock import QuantumLock, QuantumLockManager
 from CORE_LOCK.fernet_manager import FernetManager
 from CORE_LOCK.license_check import LicenseChecker, verify_license
 from CORE_LOCK.integrity_verifier import IntegrityVerifier
@@ -79,6 +79,32 @@ def test_encryption_decryption():
         os.unlink(lock_path)
 
 
+def test_malformed_license_key():
+    """Test that malformed license keys are rejected, not raised."""
+    print("Testing malformed license keys...")
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".bin") as f:
+        lock_path = f.name
+
+    try:
+        QuantumLock.generate_lock(lock_path)
+        lock = QuantumLock(lock_path, "test_model")
+
+        for bad_key in (None, 12345, b"BYTES-KEY"):
+            assert not lock.verify_license(bad_key), f"Malformed key {bad_key!r} accepted"
+            assert lock.get_status().is_locked, "Lock left unlocked"
+
+        manager = QuantumLockManager()
+        manager.register("test_model", lock_path)
+        assert manager.verify_all(None) == {"test_model": False}, "verify_all accepted malformed key"
+
+        print("  [PASS] Malformed license keys")
+        return True
+
+    finally:
+        os.unlink(lock_path)
+
+
 def test_license_verification():
     """Test license verification."""
     print("Testing license verification...")
@@ -163,6 +189,76 @@ def test_fernet_manager():
     return True
 
 
+def _stream_frames(path):
+    """Split an encrypt_stream file into its header and raw frames."""
+    data = Path(path).read_bytes()
+    header_size = len(FernetManager.STREAM_MAGIC) + FernetManager.STREAM_ID_SIZE
+    header, frames, pos = data[:header_size], [], header_size
+    while pos < len(data):
+        length = int.from_bytes(data[pos:pos + 4], "big")
+        frames.append(data[pos:pos + 4 + length])
+        pos += 4 + length
+    return header, frames
+
+
+def _assert_stream_rejected(manager, path, output_path, reason):
+    """Decrypting path must fail and leave nothing at output_path."""
+    try:
+        manager.decrypt_stream(path, output_path)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(f"{reason} stream accepted")
+    assert not os.path.exists(output_path), f"Partial output left for {reason} stream"
+
+
+def test_stream_encryption():
+    """Test streamed encryption round-trips and rejects tampered frames."""
+    print("Testing stream encryption...")
+
+    manager = FernetManager()
+    manager.generate_key()
+    chunk_size = 64
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.bin")
+        enc = os.path.join(tmp, "plain.enc")
+        out = os.path.join(tmp, "plain.out")
+
+        # Round-trip: empty, partial, exact chunk multiples
+        for size in (0, 10, chunk_size, chunk_size * 3, chunk_size * 3 + 1):
+            data = os.urandom(size)
+            Path(plain).write_bytes(data)
+            manager.encrypt_stream(plain, enc, chunk_size=chunk_size)
+            manager.decrypt_stream(enc, out)
+            assert Path(out).read_bytes() == data, f"Stream round-trip failed ({size} bytes)"
+            assert manager.decrypt_to_memory(enc) == data, f"In-memory stream failed ({size} bytes)"
+            os.unlink(out)
+
+        Path(plain).write_bytes(os.urandom(chunk_size * 3))
+        manager.encrypt_stream(plain, enc, chunk_size=chunk_size)
+        header, frames = _stream_frames(enc)
+        tampered = os.path.join(tmp, "tampered.enc")
+
+        # Truncation: drop the final frame
+        Path(tampered).write_bytes(header + b"".join(frames[:-1]))
+        _assert_stream_rejected(manager, tampered, out, "Truncated")
+
+        # Reordering: swap the first two frames
+        Path(tampered).write_bytes(header + frames[1] + frames[0] + b"".join(frames[2:]))
+        _assert_stream_rejected(manager, tampered, out, "Reordered")
+
+        # Splicing: a frame from another file encrypted under the same key
+        other = os.path.join(tmp, "other.enc")
+        manager.encrypt_stream(plain, other, chunk_size=chunk_size)
+        _, other_frames = _stream_frames(other)
+        Path(tampered).write_bytes(header + frames[0] + other_frames[1] + frames[2])
+        _assert_stream_rejected(manager, tampered, out, "Spliced")
+
+    print("  [PASS] Stream encryption")
+    return True
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 50)
@@ -173,9 +269,11 @@ def run_all_tests():
     tests = [
         test_lock_generation,
         test_encryption_decryption,
+        test_malformed_license_key,
         test_license_verification,
         test_integrity_verification,
         test_fernet_manager,
+        test_stream_encryption,
     ]
 
     passed = 0
@@ -142,6 +142,10 @@ class EthicsEngine:
         return messages.get(classification, "I'm unable to process this request.")
 
 
+# Shared engine - patterns are compiled once at import
+_DEFAULT_ENGINE = EthicsEngine()
+
+
 # Response framework
 def ethical_response(user_request: str,
                      response_handler: Optional[Callable[[str], str]] = None) -> str:
@@ -155,8 +159,7 @@ def ethical_response(user_request: str,
     Returns:
         Appropriate response based on ethical classification
     """
-    engine = EthicsEngine()
-    classification = engine.classify_request(user_request)
+    classification = _DEFAULT_ENGINE.classify_request(user_request)
 
     if classification == RequestClassification.HARMFUL:
         return "I can't help with that request"
@@ -186,14 +189,12 @@ def provide_helpful_response(request: str) -> str:
 
 def is_harmful(request: str) -> bool:
     """Quick check if request is harmful."""
-    engine = EthicsEngine()
-    return engine.is_harmful(request)
+    return _DEFAULT_ENGINE.is_harmful(request)
 
 
 def is_manipulation(request: str) -> bool:
     """Quick check if request is manipulation."""
-    engine = EthicsEngine()
-    return engine.is_manipulation(request)
+    return _DEFAULT_ENGINE.is_manipulation(request)
 
 
 class EthicalWrapper:
@@ -206,9 +207,9 @@ class EthicalWrapper:
         response = ethical_model.generate("Hello!")
     """
 
-    def __init__(self, model):
+    def __init__(self, model, ethics: Optional[EthicsEngine] = None):
         self.model = model
-        self.ethics = EthicsEngine()
+        self.ethics = ethics or _DEFAULT_ENGINE
 
     def generate(self, prompt: str, **kwargs) -> str:
         """Generate with ethical checking."""